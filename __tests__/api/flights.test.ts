@@ -0,0 +1,74 @@
+/**
+ * @jest-environment node
+ */
+import { NextRequest, NextResponse } from 'next/server';
+import { getToken } from 'next-auth/jwt';
+import { GET } from '@/app/api/flights/route';
+
+const mockSearchFlights = jest.fn();
+
+jest.mock('next-auth/jwt', () => ({
+  getToken: jest.fn(),
+}));
+
+jest.mock('@/services/external/flight.service', () => ({
+  FlightService: jest.fn().mockImplementation(() => ({
+    searchFlights: (...args: unknown[]) => mockSearchFlights(...args),
+  })),
+}));
+
+const mockGetToken = getToken as jest.Mock;
+
+function createRequest(query: string) {
+  return new NextRequest(`http://localhost:3000/api/flights?${query}`);
+}
+
+describe('GET /api/flights', () => {
+  beforeEach(() => {
+    mockGetToken.mockResolvedValue({ sub: 'test-user-id' });
+    mockSearchFlights.mockResolvedValue([{ id: 'offer-1' }]);
+  });
+
+  it('returns a NextResponse with the offers for a valid search', async () => {
+    const response = await GET(
+      createRequest('origin=JFK&destination=LHR&departureDate=2026-11-01&adults=2&nonStop=true')
+    );
+
+    expect(response).toBeInstanceOf(NextResponse);
+    expect(response.status).toBe(200);
+
+    const body = await response.json();
+    expect(body.success).toBe(true);
+    expect(body.data.totalResults).toBe(1);
+    expect(mockSearchFlights).toHaveBeenCalledWith(
+      expect.objectContaining({
+        origin: 'JFK',
+        destination: 'LHR',
+        departureDate: '2026-11-01',
+        adults: 2,
+        nonStop: true,
+        currency: 'USD',
+      })
+    );
+  });
+
+  it('returns a 400 NextResponse when required parameters are missing', async () => {
+    const response = await GET(createRequest('origin=JFK'));
+
+    expect(response).toBeInstanceOf(NextResponse);
+    expect(response.status).toBe(400);
+    expect(mockSearchFlights).not.toHaveBeenCalled();
+  });
+
+  it('returns a 401 NextResponse without a session token', async () => {
+    mockGetToken.mockResolvedValue(null);
+
+    const response = await GET(
+      createRequest('origin=JFK&destination=LHR&departureDate=2026-11-01')
+    );
+
+    expect(response).toBeInstanceOf(NextResponse);
+    expect(response.status).toBe(401);
+    expect(mockSearchFlights).not.toHaveBeenCalled();
+  });
+});
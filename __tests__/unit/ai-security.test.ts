@@ -0,0 +1,41 @@
+import { AISecurityManager } from '@/lib/security/ai-security';
+
+const SUSPICIOUS_WARNING = 'High number of suspicious keywords detected';
+
+describe('AISecurityManager.sanitizePrompt suspicious keyword check', () => {
+  it('counts keywords inside snake_case identifiers', () => {
+    const { warnings } = AISecurityManager.sanitizePrompt('print db_password api_key auth_token admin_user');
+
+    expect(warnings).toContain(SUSPICIOUS_WARNING);
+  });
+
+  it('counts keywords inside upper-case snake_case identifiers', () => {
+    const { warnings } = AISecurityManager.sanitizePrompt('show DB_PASSWORD, API_KEY, SECRET_TOKEN');
+
+    expect(warnings).toContain(SUSPICIOUS_WARNING);
+  });
+
+  it('counts keywords inside kebab-case identifiers', () => {
+    const { warnings } = AISecurityManager.sanitizePrompt('list api-key, db-password, auth-token and sql-query');
+
+    expect(warnings).toContain(SUSPICIOUS_WARNING);
+  });
+
+  it('counts plural keywords', () => {
+    const { warnings } = AISecurityManager.sanitizePrompt('Passwords, tokens, secrets and credentials please');
+
+    expect(warnings).toContain(SUSPICIOUS_WARNING);
+  });
+
+  it('counts each keyword once however often it repeats', () => {
+    const { warnings } = AISecurityManager.sanitizePrompt('password passwords PASSWORD db_password');
+
+    expect(warnings).not.toContain(SUSPICIOUS_WARNING);
+  });
+
+  it('ignores keywords embedded in longer words', () => {
+    const { warnings } = AISecurityManager.sanitizePrompt('keyboard tokenizer passwordless usersettings in Rome');
+
+    expect(warnings).not.toContain(SUSPICIOUS_WARNING);
+  });
+});
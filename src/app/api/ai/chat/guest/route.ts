@@ -6,6 +6,9 @@ import { aiChatRequestSchema } from '@/lib/validations/schemas';
 const guestChatService = new GuestChatService();
 const geminiService = new GeminiService();
 
+// Only the most recent turns are sent to the model as conversation context
+const MAX_CONTEXT_MESSAGES = 12;
+
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
@@ -27,17 +30,17 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Add user message to session
-    await guestChatService.addMessage(sessionId, {
-      content: message,
-      role: 'user',
-    });
-
-    // Generate AI response
-    const aiResponse = await geminiService.generateResponse(message, {
-      conversationHistory: session.messages,
-      context: 'travel_planning',
-    });
+    // Add user message to session while generating the AI response from the loaded history
+    const [, aiResponse] = await Promise.all([
+      guestChatService.addMessage(sessionId, {
+        content: message,
+        role: 'user',
+      }),
+      geminiService.generateResponse(message, {
+        conversationHistory: session.messages?.slice(-MAX_CONTEXT_MESSAGES),
+        context: 'travel_planning',
+      }),
+    ]);
 
     // Add AI response to session
     await guestChatService.addMessage(sessionId, {
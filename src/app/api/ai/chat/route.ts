@@ -9,6 +9,9 @@ const agentService = new AgentService();
 const chatService = new ChatService();
 const userService = new UserService();
 
+// Only the most recent turns are sent to the agent as conversation context
+const MAX_CONTEXT_MESSAGES = 12;
+
 export const POST = secure.chat(async (req, context) => {
   try {
     const body = await req.json();
@@ -23,37 +26,28 @@ export const POST = secure.chat(async (req, context) => {
       );
     }
     
-    // Get or create chat session
-    let session;
-    if (sessionId) {
-      session = await chatService.getChatSession(sessionId);
-      if (!session || session.userId !== userId) {
-        return NextResponse.json(
-          { success: false, error: 'Chat session not found' },
-          { status: 404 }
-        );
-      }
-    } else {
-      session = await chatService.createChatSession(userId, {
-        title: message.substring(0, 50) + '...',
-        context: chatContext,
-      });
-    }
+    // Get or create chat session and load user preferences concurrently
+    const [session, user] = await Promise.all([
+      sessionId
+        ? chatService.getChatSession(sessionId)
+        : chatService.createChatSession(userId, {
+            title: message.substring(0, 50) + '...',
+            context: chatContext,
+          }),
+      userService.getUserById(userId),
+    ]);
 
-    // Get user preferences
-    const user = await userService.getUserById(userId);
+    if (!session || session.userId !== userId) {
+      return NextResponse.json(
+        { success: false, error: 'Chat session not found' },
+        { status: 404 }
+      );
+    }
     
-    // Add user message to session
-    await chatService.addMessage(session.id, {
-      content: message,
-      role: 'user',
-      attachments,
-    });
-
     // Process message with AI agent
     const agentContext: any = {
       userId,
-      conversationHistory: session.messages,
+      conversationHistory: session.messages?.slice(-MAX_CONTEXT_MESSAGES),
       activeTools: chatContext?.activeTools || [],
     };
     
@@ -65,7 +59,15 @@ export const POST = secure.chat(async (req, context) => {
       agentContext.userPreferences = user.preferences;
     }
 
-    const aiResponse = await agentService.processMessage(message, agentContext);
+    // Persist the user message while the agent works; the agent only needs the loaded history
+    const [, aiResponse] = await Promise.all([
+      chatService.addMessage(session.id, {
+        content: message,
+        role: 'user',
+        attachments,
+      }),
+      agentService.processMessage(message, agentContext),
+    ]);
 
     // Add AI response to session
     const updatedSession = await chatService.addMessage(session.id, {
@@ -10,6 +10,16 @@ const geminiService = new GeminiService();
 const itineraryService = new ItineraryService();
 const userService = new UserService();
 
+function buildItineraryPrompt(
+  destination: string,
+  startDate: string,
+  endDate: string,
+  travelers: number,
+  budget: number
+): string {
+  return `Create a detailed travel itinerary for ${destination} from ${startDate} to ${endDate} for ${travelers} travelers with a budget of $${budget}.`;
+}
+
 export async function POST(request: NextRequest) {
   return withValidation(
     aiItineraryRequestSchema,
@@ -20,13 +30,13 @@ export async function POST(request: NextRequest) {
           try {
             const { destination, startDate, endDate, travelers, budget, preferences, prompt } = data;
             
-            // Get user preferences
-            const user = await userService.getUserById(token.uid as string);
-            const userPreferences = preferences || user?.preferences || {};
+            // Get user preferences, only looking up the user when none were supplied
+            const userPreferences = preferences
+              || (await userService.getUserById(token.uid as string))?.preferences
+              || {};
 
             // Generate itinerary using AI
-            const itineraryPrompt = prompt || 
-              `Create a detailed travel itinerary for ${destination} from ${startDate} to ${endDate} for ${travelers} travelers with a budget of $${budget}.`;
+            const itineraryPrompt = prompt || buildItineraryPrompt(destination, startDate, endDate, travelers, budget);
 
             const aiItinerary = await geminiService.generateItinerary(itineraryPrompt, userPreferences);
 
@@ -33,8 +33,9 @@ export async function GET(request: NextRequest) {
             if (location && type) {
               // Search by location and type
               results = await vectorService.searchByType(type, query, { topK: topKNumber });
+              const normalizedLocation = location.toLowerCase();
               results = results.filter(result => 
-                result.metadata.location?.toLowerCase().includes(location.toLowerCase())
+                result.metadata.location?.toLowerCase().includes(normalizedLocation)
               );
             } else if (location) {
               // Search by location
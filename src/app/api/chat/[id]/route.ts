@@ -52,9 +52,11 @@ export async function PUT(request: NextRequest, { params }: { params: { id: stri
     async (req, token) => {
       try {
         const { id } = params;
-        const updateData = await req.json();
-        
-        const session = await chatService.getChatSession(id);
+        // Body parsing and the session lookup are independent, so run them together
+        const [updateData, session] = await Promise.all([
+          req.json(),
+          chatService.getChatSession(id),
+        ]);
         if (!session) {
           return NextResponse.json(
             { success: false, error: 'Chat session not found' },
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { withAuth } from '@/lib/middleware/auth';
 import { withQueryValidation } from '@/lib/middleware/validation';
 import { CountriesService } from '@/services/external/countries.service';
+import { cacheManager, createCacheKey } from '@/lib/performance/cache';
 import { z } from 'zod';
 
 const countriesQuerySchema = z.object({
@@ -16,6 +17,25 @@ const countriesQuerySchema = z.object({
   continent: z.string().optional(),
 });
 
+const countriesService = new CountriesService();
+
+// Country data is effectively static, so lookups are cached for a day
+const COUNTRIES_CACHE = 'countries';
+if (!cacheManager.hasCache(COUNTRIES_CACHE)) {
+  cacheManager.createCache(COUNTRIES_CACHE, { ttl: 24 * 60 * 60, maxSize: 1000 });
+}
+
+function getCachedCountries<T>(lookup: string, value: string, loader: () => Promise<T>): Promise<T> {
+  return cacheManager.getOrLoad(
+    COUNTRIES_CACHE,
+    createCacheKey(`countries:${lookup}`, { value }),
+    loader,
+    undefined,
+    // Don't pin empty lookups for the full TTL; they may be transient upstream failures
+    result => !Array.isArray(result) || result.length > 0
+  );
+}
+
 export async function GET(request: NextRequest) {
   return withQueryValidation(
     countriesQuerySchema,
@@ -25,7 +45,6 @@ export async function GET(request: NextRequest) {
         async (authReq, token) => {
           try {
             const { action, query, code, region, subregion, capital, language, currency, continent } = queryData;
-            const countriesService = new CountriesService();
 
             let countries = [];
 
@@ -37,7 +56,7 @@ export async function GET(request: NextRequest) {
                     { status: 400 }
                   );
                 }
-                countries = await countriesService.searchCountries(query);
+                countries = await getCachedCountries('search', query, () => countriesService.searchCountries(query));
                 break;
 
               case 'region':
@@ -47,7 +66,7 @@ export async function GET(request: NextRequest) {
                     { status: 400 }
                   );
                 }
-                countries = await countriesService.getCountriesByRegion(region);
+                countries = await getCachedCountries('region', region, () => countriesService.getCountriesByRegion(region));
                 break;
 
               case 'subregion':
@@ -57,7 +76,7 @@ export async function GET(request: NextRequest) {
                     { status: 400 }
                   );
                 }
-                countries = await countriesService.getCountriesBySubregion(subregion);
+                countries = await getCachedCountries('subregion', subregion, () => countriesService.getCountriesBySubregion(subregion));
                 break;
 
               case 'capital':
@@ -67,7 +86,7 @@ export async function GET(request: NextRequest) {
                     { status: 400 }
                   );
                 }
-                countries = await countriesService.getCountriesByCapital(capital);
+                countries = await getCachedCountries('capital', capital, () => countriesService.getCountriesByCapital(capital));
                 break;
 
               case 'language':
@@ -77,7 +96,7 @@ export async function GET(request: NextRequest) {
                     { status: 400 }
                   );
                 }
-                countries = await countriesService.getCountriesByLanguage(language);
+                countries = await getCachedCountries('language', language, () => countriesService.getCountriesByLanguage(language));
                 break;
 
               case 'currency':
@@ -87,11 +106,11 @@ export async function GET(request: NextRequest) {
                     { status: 400 }
                   );
                 }
-                countries = await countriesService.getCountriesByCurrency(currency);
+                countries = await getCachedCountries('currency', currency, () => countriesService.getCountriesByCurrency(currency));
                 break;
 
               case 'popular':
-                countries = await countriesService.getPopularDestinations();
+                countries = await getCachedCountries('popular', '', () => countriesService.getPopularDestinations());
                 break;
 
               case 'continent':
@@ -101,12 +120,12 @@ export async function GET(request: NextRequest) {
                     { status: 400 }
                   );
                 }
-                countries = await countriesService.getCountriesByContinent(continent);
+                countries = await getCachedCountries('continent', continent, () => countriesService.getCountriesByContinent(continent));
                 break;
 
               case 'all':
               default:
-                countries = await countriesService.getAllCountries();
+                countries = await getCachedCountries('all', '', () => countriesService.getAllCountries());
                 break;
             }
 
@@ -158,8 +177,7 @@ export async function POST(request: NextRequest) {
           );
         }
 
-        const countriesService = new CountriesService();
-        const country = await countriesService.getCountryByCode(code);
+        const country = await getCachedCountries('code', code, () => countriesService.getCountryByCode(code));
 
         if (!country) {
           return NextResponse.json(
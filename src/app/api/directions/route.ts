@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { withAuth } from '@/lib/middleware/auth';
 import { withQueryValidation } from '@/lib/middleware/validation';
 import { MapsService } from '@/services/external/maps.service';
+import { cacheManager, createCacheKey } from '@/lib/performance/cache';
 import { z } from 'zod';
 
 const directionsQuerySchema = z.object({
@@ -10,6 +11,14 @@ const directionsQuerySchema = z.object({
   mode: z.enum(['driving', 'walking', 'bicycling', 'transit']).default('driving'),
 });
 
+const mapsService = new MapsService();
+
+// Routes between the same endpoints rarely change within a few minutes
+const DIRECTIONS_CACHE = 'directions';
+if (!cacheManager.hasCache(DIRECTIONS_CACHE)) {
+  cacheManager.createCache(DIRECTIONS_CACHE, { ttl: 15 * 60, maxSize: 500 });
+}
+
 export async function GET(request: NextRequest) {
   // Skip during static generation
   if (process.env.NODE_ENV === 'production' && !request.headers.get('authorization')) {
@@ -24,9 +33,12 @@ export async function GET(request: NextRequest) {
         async (authReq, token) => {
           try {
             const { origin, destination, mode } = queryData;
-            const mapsService = new MapsService();
 
-            const routes = await mapsService.getDirections(origin, destination, mode);
+            const routes = await cacheManager.getOrLoad(
+              DIRECTIONS_CACHE,
+              createCacheKey('directions', { origin, destination, mode }),
+              () => mapsService.getDirections(origin, destination, mode)
+            );
 
             if (routes.length === 0) {
               return NextResponse.json(
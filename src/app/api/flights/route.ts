@@ -18,78 +18,36 @@ const flightSearchSchema = z.object({
   currency: z.string().default('USD'),
 });
 
+const flightService = new FlightService();
+
 export async function GET(request: NextRequest) {
-  return withAuth(
-    request,
-    async (authReq, token) => {
-      try {
-        const url = new URL(request.url);
-        const queryParams = Object.fromEntries(url.searchParams.entries());
-        
-        // Parse and validate query parameters
-        const origin = queryParams.origin;
-        const destination = queryParams.destination;
-        const departureDate = queryParams.departureDate;
-        const returnDate = queryParams.returnDate;
-        const adults = parseInt(queryParams.adults || '1', 10);
-        const children = queryParams.children ? parseInt(queryParams.children, 10) : undefined;
-        const infants = queryParams.infants ? parseInt(queryParams.infants, 10) : undefined;
-        const travelClass = queryParams.travelClass as 'ECONOMY' | 'PREMIUM_ECONOMY' | 'BUSINESS' | 'FIRST' | undefined;
-        const nonStop = queryParams.nonStop === 'true';
-        const maxPrice = queryParams.maxPrice ? parseInt(queryParams.maxPrice, 10) : undefined;
-        const currency = queryParams.currency || 'USD';
+  return withQueryValidation(
+    flightSearchSchema,
+    async (req, searchParams) => {
+      return withAuth(
+        req,
+        async (authReq, token) => {
+          try {
+            const flightOffers = await flightService.searchFlights(searchParams);
 
-        if (!origin || !destination || !departureDate) {
-          return NextResponse.json(
-            { success: false, error: 'Missing required parameters: origin, destination, departureDate' },
-            { status: 400 }
-          );
+            return NextResponse.json({
+              success: true,
+              data: {
+                offers: flightOffers,
+                searchParams,
+                totalResults: flightOffers.length,
+              },
+              message: `Found ${flightOffers.length} flight offers`,
+            });
+          } catch (error) {
+            console.error('Error searching flights:', error);
+            return NextResponse.json(
+              { success: false, error: 'Failed to search flights' },
+              { status: 500 }
+            );
+          }
         }
-
-        const flightService = new FlightService();
-        
-        const flightOffers = await flightService.searchFlights({
-          origin,
-          destination,
-          departureDate,
-          returnDate,
-          adults,
-          children,
-          infants,
-          travelClass,
-          nonStop,
-          maxPrice,
-          currency,
-        });
-
-        return NextResponse.json({
-          success: true,
-          data: {
-            offers: flightOffers,
-            searchParams: {
-              origin,
-              destination,
-              departureDate,
-              returnDate,
-              adults,
-              children,
-              infants,
-              travelClass,
-              nonStop,
-              maxPrice,
-              currency,
-            },
-            totalResults: flightOffers.length,
-          },
-          message: `Found ${flightOffers.length} flight offers`,
-        });
-      } catch (error) {
-        console.error('Error searching flights:', error);
-        return NextResponse.json(
-          { success: false, error: 'Failed to search flights' },
-          { status: 500 }
-        );
-      }
+      );
     }
-  );
+  )(request);
 }
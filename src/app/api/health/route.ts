@@ -4,10 +4,16 @@ import { withErrorHandling } from '@/lib/error-handling/production';
 async function healthCheck() {
   const startTime = Date.now();
   
+  // Independent dependency checks run concurrently
+  const [database, externalServices] = await Promise.all([
+    checkDatabase(),
+    checkExternalServices(),
+  ]);
+  
   // Basic health checks
   const checks = {
-    database: await checkDatabase(),
-    externalServices: await checkExternalServices(),
+    database,
+    externalServices,
     memory: checkMemoryUsage(),
     uptime: process.uptime(),
   };
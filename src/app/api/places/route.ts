@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { withAuth } from '@/lib/middleware/auth';
 import { withQueryValidation } from '@/lib/middleware/validation';
 import { MapsService } from '@/services/external/maps.service';
+import { cacheManager, createCacheKey } from '@/lib/performance/cache';
 import { z } from 'zod';
 
 const placesQuerySchema = z.object({
@@ -13,6 +14,29 @@ const placesQuerySchema = z.object({
   placeId: z.string().optional(),
 });
 
+const mapsService = new MapsService();
+
+// Place details and nearby results change rarely, so they are cached for an hour
+const PLACES_CACHE = 'places';
+if (!cacheManager.hasCache(PLACES_CACHE)) {
+  cacheManager.createCache(PLACES_CACHE, { ttl: 60 * 60, maxSize: 500 });
+}
+
+// Round to 3 decimal places (~110 m) so nearby searches from almost the same point share a cache entry
+function roundCoordinate(value: number): number {
+  return Math.round(value * 1000) / 1000;
+}
+
+// Parse a "lat,lng" string in one pass; undefined when either part is not a number
+function parseCoordinates(location: string): { lat: number; lng: number } | undefined {
+  const separatorIndex = location.indexOf(',');
+  if (separatorIndex === -1) return undefined;
+
+  const lat = parseFloat(location.slice(0, separatorIndex));
+  const lng = parseFloat(location.slice(separatorIndex + 1));
+  return isNaN(lat) || isNaN(lng) ? undefined : { lat, lng };
+}
+
 export async function GET(request: NextRequest) {
   return withAuth(
     request,
@@ -27,6 +51,7 @@ export async function GET(request: NextRequest) {
         const type = queryParams.type;
         const action = queryParams.action || 'search';
         const placeId = queryParams.placeId;
+        const coordinates = location ? parseCoordinates(location) : undefined;
 
         if (!query && action !== 'details') {
           return NextResponse.json(
@@ -43,10 +68,13 @@ export async function GET(request: NextRequest) {
           );
         }
 
-        const mapsService = new MapsService();
-
         if (action === 'details' && placeId) {
-          const place = await mapsService.getPlaceDetails(placeId);
+          // Place IDs are case-sensitive, so they are hashed as exact params rather than normalized
+          const place = await cacheManager.getOrLoad(
+            PLACES_CACHE,
+            createCacheKey('places:details', {}, { placeId }),
+            () => mapsService.getPlaceDetails(placeId)
+          );
           
           if (!place) {
             return NextResponse.json(
@@ -63,21 +91,22 @@ export async function GET(request: NextRequest) {
         }
 
         if (action === 'nearby' && location) {
-          const coords = location.split(',').map(coord => parseFloat(coord.trim()));
-          const lat = coords[0];
-          const lng = coords[1];
-          
-          if (!lat || !lng || isNaN(lat) || isNaN(lng)) {
+          if (!coordinates) {
             return NextResponse.json(
               { success: false, error: 'Invalid location format. Use "lat,lng"' },
               { status: 400 }
             );
           }
 
-          const places = await mapsService.getNearbyPlaces(
-            { lat, lng },
-            radius || 1000,
-            type
+          const center = {
+            lat: roundCoordinate(coordinates.lat),
+            lng: roundCoordinate(coordinates.lng),
+          };
+          const searchRadius = radius || 1000;
+          const places = await cacheManager.getOrLoad(
+            PLACES_CACHE,
+            createCacheKey('places:nearby', { ...center, radius: searchRadius, type }),
+            () => mapsService.getNearbyPlaces(center, searchRadius, type)
           );
 
           return NextResponse.json({
@@ -85,8 +114,8 @@ export async function GET(request: NextRequest) {
             data: {
               places,
               searchParams: {
-                location: { lat, lng },
-                radius: radius || 1000,
+                location: center,
+                radius: searchRadius,
                 type,
               },
               totalResults: places.length,
@@ -96,16 +125,9 @@ export async function GET(request: NextRequest) {
         }
 
         // Default: search places
-        const locationObj = location ? (() => {
-          const coords = location.split(',').map(coord => parseFloat(coord.trim()));
-          const lat = coords[0];
-          const lng = coords[1];
-          return (!lat || !lng || isNaN(lat) || isNaN(lng)) ? undefined : { lat, lng };
-        })() : undefined;
-
         const places = await mapsService.searchPlaces(
           query!,
-          locationObj,
+          coordinates,
           radius,
           type
         );
@@ -116,7 +138,7 @@ export async function GET(request: NextRequest) {
             places,
             searchParams: {
               query,
-              location: locationObj,
+              location: coordinates,
               radius,
               type,
             },
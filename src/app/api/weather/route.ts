@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { secure } from '@/lib/security';
 import { WeatherService } from '@/services/external/weather.service';
+import { cacheManager, createCacheKey } from '@/lib/performance/cache';
 import { z } from 'zod';
 
 const weatherQuerySchema = z.object({
@@ -9,6 +10,33 @@ const weatherQuerySchema = z.object({
   days: z.string().optional().transform(val => val ? parseInt(val, 10) : 5),
 });
 
+const weatherService = new WeatherService();
+
+// Weather changes slowly, so repeat lookups are cached for 15 minutes
+// (in memory, and in Redis when configured so entries survive restarts)
+const WEATHER_CACHE = 'weather';
+if (!cacheManager.hasCache(WEATHER_CACHE)) {
+  cacheManager.createCache(WEATHER_CACHE, { ttl: 15 * 60, maxSize: 500, persistent: true });
+}
+
+const DEFAULT_FORECAST_DAYS = 5;
+
+function getCachedCurrentWeather(location: string) {
+  return cacheManager.getOrLoad(
+    WEATHER_CACHE,
+    createCacheKey('weather:current', { location }),
+    () => weatherService.getCurrentWeather(location)
+  );
+}
+
+function getCachedForecast(location: string, days: number) {
+  return cacheManager.getOrLoad(
+    WEATHER_CACHE,
+    createCacheKey('weather:forecast', { location, days }),
+    () => weatherService.getWeatherForecast(location, days)
+  );
+}
+
 export const GET = secure.user(async (req, context) => {
   try {
     const url = new URL(req.url);
@@ -16,7 +44,7 @@ export const GET = secure.user(async (req, context) => {
     
     const location = queryParams.location;
     const type = queryParams.type || 'current';
-    const days = queryParams.days ? parseInt(queryParams.days, 10) : 5;
+    const days = queryParams.days ? parseInt(queryParams.days, 10) : DEFAULT_FORECAST_DAYS;
 
     if (!location) {
       return NextResponse.json(
@@ -25,10 +53,8 @@ export const GET = secure.user(async (req, context) => {
       );
     }
 
-    const weatherService = new WeatherService();
-
     if (type === 'forecast') {
-      const forecast = await weatherService.getWeatherForecast(location, days);
+      const forecast = await getCachedForecast(location, days);
       
       if (!forecast) {
         return NextResponse.json(
@@ -43,7 +69,7 @@ export const GET = secure.user(async (req, context) => {
         message: `Weather forecast for ${location}`,
       });
     } else {
-      const weather = await weatherService.getCurrentWeather(location);
+      const weather = await getCachedCurrentWeather(location);
       
       if (!weather) {
         return NextResponse.json(
@@ -410,18 +410,21 @@ const Input = React.forwardRef<HTMLInputElement, InputProps>(
       return { isValid: errors.length === 0, errors };
     }, [validation]);
     
+    // Compile the mask once per mask rather than on every keystroke
+    const maskRegex = React.useMemo(() => {
+      if (!mask) return null;
+      // Simple mask implementation - can be enhanced
+      const maskPattern = mask.replace(/9/g, '\\d');
+      return new RegExp(`^${maskPattern}$`);
+    }, [mask]);
+    
     // Handle value change
     const handleValueChange = React.useCallback((newValue: string) => {
       let processedValue = newValue;
       
       // Apply mask
-      if (mask) {
-        // Simple mask implementation - can be enhanced
-        const maskPattern = mask.replace(/9/g, '\\d');
-        const regex = new RegExp(`^${maskPattern}$`);
-        if (!regex.test(newValue)) {
-          return;
-        }
+      if (maskRegex && !maskRegex.test(newValue)) {
+        return;
       }
       
       // Apply format
@@ -444,7 +447,7 @@ const Input = React.forwardRef<HTMLInputElement, InputProps>(
       
       // Call callbacks
       onValueChange?.(processedValue);
-    }, [mask, format, value, validateOnChange, validateInput, onValidationChange, onValueChange]);
+    }, [maskRegex, format, value, validateOnChange, validateInput, onValidationChange, onValueChange]);
     
     // Handle input change
     const handleChange = React.useCallback((event: React.ChangeEvent<HTMLInputElement>) => {
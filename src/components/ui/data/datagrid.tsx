@@ -189,11 +189,12 @@ const DataGrid = forwardRef<HTMLDivElement, DataGridProps>(
 
       // Apply search
       if (searchQuery && searchable) {
+        const normalizedQuery = searchQuery.toLowerCase();
         result = result.filter(record =>
           orderedColumns.some(column => {
             if (!column.searchable) return false;
             const value = column.dataIndex ? record[column.dataIndex] : record[column.key];
-            return String(value).toLowerCase().includes(searchQuery.toLowerCase());
+            return String(value).toLowerCase().includes(normalizedQuery);
           })
         );
       }
@@ -201,10 +202,11 @@ const DataGrid = forwardRef<HTMLDivElement, DataGridProps>(
       // Apply filters
       Object.entries(filters).forEach(([key, value]) => {
         if (value !== undefined && value !== '') {
+          const normalizedValue = typeof value === 'string' ? value.toLowerCase() : null;
           result = result.filter(record => {
             const recordValue = record[key];
-            if (typeof value === 'string') {
-              return String(recordValue).toLowerCase().includes(value.toLowerCase());
+            if (normalizedValue !== null) {
+              return String(recordValue).toLowerCase().includes(normalizedValue);
             }
             return recordValue === value;
           });
@@ -200,9 +200,10 @@ const Graphs = forwardRef<HTMLDivElement, GraphsProps>(
         return;
       }
 
+      const normalizedQuery = searchQuery.toLowerCase();
       const filtered = data.nodes.filter(node =>
-        node.label.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        node.id.toLowerCase().includes(searchQuery.toLowerCase())
+        node.label.toLowerCase().includes(normalizedQuery) ||
+        node.id.toLowerCase().includes(normalizedQuery)
       );
 
       const filteredNodeIds = new Set(filtered.map(node => node.id));
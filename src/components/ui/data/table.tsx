@@ -117,10 +117,11 @@ const Table = forwardRef<HTMLTableElement, TableProps>(
 
       // Apply search
       if (searchQuery && searchable) {
+        const normalizedQuery = searchQuery.toLowerCase();
         result = result.filter(record =>
           columns.some(column => {
             const value = column.dataIndex ? record[column.dataIndex] : record[column.key];
-            return String(value).toLowerCase().includes(searchQuery.toLowerCase());
+            return String(value).toLowerCase().includes(normalizedQuery);
           })
         );
       }
@@ -128,10 +129,11 @@ const Table = forwardRef<HTMLTableElement, TableProps>(
       // Apply filters
       Object.entries(filters).forEach(([key, value]) => {
         if (value !== undefined && value !== '') {
+          const normalizedValue = typeof value === 'string' ? value.toLowerCase() : null;
           result = result.filter(record => {
             const recordValue = record[key];
-            if (typeof value === 'string') {
-              return String(recordValue).toLowerCase().includes(value.toLowerCase());
+            if (normalizedValue !== null) {
+              return String(recordValue).toLowerCase().includes(normalizedValue);
             }
             return recordValue === value;
           });
@@ -556,20 +556,22 @@ const EnhancedSelect = React.forwardRef<
   const filteredOptions = React.useMemo(() => {
     if (!searchQuery) return options;
     
+    const normalizedQuery = searchQuery.toLowerCase();
     return options.filter(option => 
-      option.label.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      option.description?.toLowerCase().includes(searchQuery.toLowerCase())
+      option.label.toLowerCase().includes(normalizedQuery) ||
+      option.description?.toLowerCase().includes(normalizedQuery)
     );
   }, [options, searchQuery]);
 
   const filteredGroups = React.useMemo(() => {
     if (!searchQuery) return groups;
     
+    const normalizedQuery = searchQuery.toLowerCase();
     return groups.map(group => ({
       ...group,
       options: group.options.filter(option => 
-        option.label.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        option.description?.toLowerCase().includes(searchQuery.toLowerCase())
+        option.label.toLowerCase().includes(normalizedQuery) ||
+        option.description?.toLowerCase().includes(normalizedQuery)
       )
     })).filter(group => group.options.length > 0);
   }, [groups, searchQuery]);
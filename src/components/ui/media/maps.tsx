@@ -234,10 +234,11 @@ const Maps = forwardRef<HTMLDivElement, MapsProps>(
         return;
       }
 
+      const normalizedQuery = searchQuery.toLowerCase();
       const filtered = data.markers.filter(marker =>
-        marker.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        marker.description?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        marker.category?.toLowerCase().includes(searchQuery.toLowerCase())
+        marker.title.toLowerCase().includes(normalizedQuery) ||
+        marker.description?.toLowerCase().includes(normalizedQuery) ||
+        marker.category?.toLowerCase().includes(normalizedQuery)
       );
 
       setFilteredMarkers(filtered);
@@ -467,10 +467,11 @@ const EnhancedDropdownMenu = React.forwardRef<
   const filteredGroups = React.useMemo(() => {
     if (!searchQuery || !groups) return groups;
     
+    const normalizedQuery = searchQuery.toLowerCase();
     return groups.map(group => ({
       ...group,
       items: group.items.filter(item => 
-        item.label.toLowerCase().includes(searchQuery.toLowerCase())
+        item.label.toLowerCase().includes(normalizedQuery)
       )
     })).filter(group => group.items.length > 0);
   }, [groups, searchQuery]);
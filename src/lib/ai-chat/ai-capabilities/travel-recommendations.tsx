@@ -181,6 +181,19 @@ export const TravelRecommendationsProvider = React.forwardRef<HTMLDivElement, Tr
 
 TravelRecommendationsProvider.displayName = 'TravelRecommendationsProvider';
 
+// Icon per recommendation type, resolved with a single lookup
+const RECOMMENDATION_ICONS: Record<string, string> = {
+  culture: '🏛️',
+  food: '🍽️',
+  nature: '🌿',
+  hotel: '🏨',
+  bnb: '🏡',
+  apartment: '🏢',
+  local: '🍴',
+  'fine-dining': '🍾',
+  'street-food': '🌮',
+};
+
 // Travel Recommendations Engine Component
 interface TravelRecommendationsEngineProps extends VariantProps<typeof travelRecommendationsVariants> {
   className?: string;
@@ -373,16 +386,7 @@ export const TravelRecommendationsEngine = React.forwardRef<HTMLDivElement, Trav
 
     const getRecommendationIcon = (recommendation: any) => {
       if (recommendation.image) return recommendation.image;
-      if (recommendation.type === 'culture') return '🏛️';
-      if (recommendation.type === 'food') return '🍽️';
-      if (recommendation.type === 'nature') return '🌿';
-      if (recommendation.type === 'hotel') return '🏨';
-      if (recommendation.type === 'bnb') return '🏡';
-      if (recommendation.type === 'apartment') return '🏢';
-      if (recommendation.type === 'local') return '🍴';
-      if (recommendation.type === 'fine-dining') return '🍾';
-      if (recommendation.type === 'street-food') return '🌮';
-      return '📍';
+      return RECOMMENDATION_ICONS[recommendation.type] || '📍';
     };
 
     const getScoreColor = (score: number) => {
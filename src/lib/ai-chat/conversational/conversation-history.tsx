@@ -253,14 +253,15 @@ export const ConversationHistoryManager = React.forwardRef<HTMLDivElement, Conve
     const [isActive, setIsActive] = useState(false);
 
     const searchConversations = useCallback((query: string) => {
+      const normalizedQuery = query.toLowerCase();
       setHistory(prev => ({
         ...prev,
         searchQuery: query,
         filteredConversations: query 
           ? prev.conversations.filter(conv => 
-              conv.title.toLowerCase().includes(query.toLowerCase()) ||
-              conv.summary.toLowerCase().includes(query.toLowerCase()) ||
-              conv.topics.some(topic => topic.toLowerCase().includes(query.toLowerCase()))
+              conv.title.toLowerCase().includes(normalizedQuery) ||
+              conv.summary.toLowerCase().includes(normalizedQuery) ||
+              conv.topics.some(topic => topic.toLowerCase().includes(normalizedQuery))
             )
           : []
       }));
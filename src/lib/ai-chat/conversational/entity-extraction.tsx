@@ -10,7 +10,7 @@
 
 'use client';
 
-import React, { useState, useEffect, useCallback, useRef } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { cva, type VariantProps } from 'class-variance-authority';
 import { cn } from '@/lib/utils';
 
@@ -181,6 +181,18 @@ export const EntityExtractionProvider = React.forwardRef<HTMLDivElement, EntityE
 
 EntityExtractionProvider.displayName = 'EntityExtractionProvider';
 
+// Wrap each extracted entity span in a highlight mark
+function highlightEntities(text: string, entities: any[]): string {
+  let highlightedText = text;
+  entities.forEach((entity, index) => {
+    const before = highlightedText.substring(0, entity.start);
+    const after = highlightedText.substring(entity.end);
+    const entityText = highlightedText.substring(entity.start, entity.end);
+    highlightedText = before + `<mark class="bg-yellow-200 dark:bg-yellow-800 px-1 rounded">${entityText}</mark>` + after;
+  });
+  return highlightedText;
+}
+
 // Entity Extraction Engine Component
 interface EntityExtractionEngineProps extends VariantProps<typeof entityExtractionVariants> {
   className?: string;
@@ -307,16 +319,11 @@ export const EntityExtractionEngine = React.forwardRef<HTMLDivElement, EntityExt
       return 'text-red-600 dark:text-red-400';
     };
 
-    const highlightEntities = (text: string, entities: any[]) => {
-      let highlightedText = text;
-      entities.forEach((entity, index) => {
-        const before = highlightedText.substring(0, entity.start);
-        const after = highlightedText.substring(entity.end);
-        const entityText = highlightedText.substring(entity.start, entity.end);
-        highlightedText = before + `<mark class="bg-yellow-200 dark:bg-yellow-800 px-1 rounded">${entityText}</mark>` + after;
-      });
-      return highlightedText;
-    };
+    // Only re-highlight when the text or the extracted entities change, not on every re-render
+    const highlightedInput = useMemo(
+      () => highlightEntities(input, extractedEntities),
+      [input, extractedEntities]
+    );
 
     return (
       <div
@@ -392,7 +399,7 @@ export const EntityExtractionEngine = React.forwardRef<HTMLDivElement, EntityExt
                 <div 
                   className="p-3 bg-gray-50 rounded-md dark:bg-gray-700"
                   dangerouslySetInnerHTML={{ 
-                    __html: highlightEntities(input, extractedEntities) 
+                    __html: highlightedInput 
                   }}
                 />
               </div>
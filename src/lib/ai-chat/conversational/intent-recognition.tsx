@@ -54,6 +54,64 @@ const intentRecognitionVariants = cva(
   }
 );
 
+// Known intents grouped by category
+const INTENTS = {
+  travel: [
+    { name: 'plan_trip', description: 'Plan a new trip', confidence: 0.95, examples: ['I want to plan a trip', 'Help me plan my vacation'] },
+    { name: 'find_destination', description: 'Find travel destination', confidence: 0.92, examples: ['Where should I go?', 'Best places to visit'] },
+    { name: 'get_recommendations', description: 'Get travel recommendations', confidence: 0.88, examples: ['What do you recommend?', 'Suggest activities'] },
+    { name: 'compare_options', description: 'Compare travel options', confidence: 0.85, examples: ['Compare destinations', 'Which is better?'] }
+  ],
+  booking: [
+    { name: 'book_flight', description: 'Book a flight', confidence: 0.94, examples: ['Book a flight', 'I need to fly'] },
+    { name: 'book_hotel', description: 'Book accommodation', confidence: 0.91, examples: ['Book a hotel', 'Find accommodation'] },
+    { name: 'book_activity', description: 'Book activities', confidence: 0.87, examples: ['Book tours', 'Reserve activities'] },
+    { name: 'modify_booking', description: 'Modify existing booking', confidence: 0.83, examples: ['Change my booking', 'Modify reservation'] }
+  ],
+  information: [
+    { name: 'get_weather', description: 'Get weather information', confidence: 0.89, examples: ['What\'s the weather?', 'Weather forecast'] },
+    { name: 'get_culture', description: 'Get cultural information', confidence: 0.86, examples: ['Tell me about culture', 'Local customs'] },
+    { name: 'get_transport', description: 'Get transportation info', confidence: 0.84, examples: ['How to get around?', 'Transportation options'] },
+    { name: 'get_safety', description: 'Get safety information', confidence: 0.82, examples: ['Is it safe?', 'Safety tips'] }
+  ],
+  support: [
+    { name: 'get_help', description: 'Get general help', confidence: 0.90, examples: ['I need help', 'Can you help me?'] },
+    { name: 'report_issue', description: 'Report an issue', confidence: 0.88, examples: ['I have a problem', 'Something went wrong'] },
+    { name: 'contact_support', description: 'Contact support', confidence: 0.85, examples: ['Contact support', 'Speak to someone'] },
+    { name: 'feedback', description: 'Provide feedback', confidence: 0.83, examples: ['Give feedback', 'Rate experience'] }
+  ]
+};
+
+// Intent name -> category, built once so lookups are a single property read
+const INTENT_CATEGORIES: Record<string, string> = Object.fromEntries(
+  Object.entries(INTENTS).flatMap(([category, categoryIntents]) =>
+    categoryIntents.map(intent => [intent.name, category])
+  )
+);
+
+const ALL_INTENTS = Object.values(INTENTS).flat();
+
+// Intent icon dispatch: one scan of the intent name, then a table lookup
+const INTENT_ICON_PATTERN = /plan|trip|book|weather|help|support|culture|transport|safety|feedback/;
+
+const INTENT_ICONS: Record<string, string> = {
+  plan: '🗺️',
+  trip: '🗺️',
+  book: '📅',
+  weather: '🌤️',
+  help: '🆘',
+  support: '🆘',
+  culture: '🏛️',
+  transport: '🚌',
+  safety: '🛡️',
+  feedback: '💬'
+};
+
+const getIntentIcon = (intentName: string) => {
+  const match = INTENT_ICON_PATTERN.exec(intentName);
+  return (match && INTENT_ICONS[match[0]]) || '🎯';
+};
+
 // Intent Recognition Toggle Props
 interface IntentRecognitionToggleProps extends VariantProps<typeof intentRecognitionVariants> {
   className?: string;
@@ -204,47 +262,19 @@ export const IntentRecognitionEngine = React.forwardRef<HTMLDivElement, IntentRe
     const [detectedIntent, setDetectedIntent] = useState<any>(null);
     const [intentHistory, setIntentHistory] = useState<any[]>([]);
 
-    const intents = {
-      travel: [
-        { name: 'plan_trip', description: 'Plan a new trip', confidence: 0.95, examples: ['I want to plan a trip', 'Help me plan my vacation'] },
-        { name: 'find_destination', description: 'Find travel destination', confidence: 0.92, examples: ['Where should I go?', 'Best places to visit'] },
-        { name: 'get_recommendations', description: 'Get travel recommendations', confidence: 0.88, examples: ['What do you recommend?', 'Suggest activities'] },
-        { name: 'compare_options', description: 'Compare travel options', confidence: 0.85, examples: ['Compare destinations', 'Which is better?'] }
-      ],
-      booking: [
-        { name: 'book_flight', description: 'Book a flight', confidence: 0.94, examples: ['Book a flight', 'I need to fly'] },
-        { name: 'book_hotel', description: 'Book accommodation', confidence: 0.91, examples: ['Book a hotel', 'Find accommodation'] },
-        { name: 'book_activity', description: 'Book activities', confidence: 0.87, examples: ['Book tours', 'Reserve activities'] },
-        { name: 'modify_booking', description: 'Modify existing booking', confidence: 0.83, examples: ['Change my booking', 'Modify reservation'] }
-      ],
-      information: [
-        { name: 'get_weather', description: 'Get weather information', confidence: 0.89, examples: ['What\'s the weather?', 'Weather forecast'] },
-        { name: 'get_culture', description: 'Get cultural information', confidence: 0.86, examples: ['Tell me about culture', 'Local customs'] },
-        { name: 'get_transport', description: 'Get transportation info', confidence: 0.84, examples: ['How to get around?', 'Transportation options'] },
-        { name: 'get_safety', description: 'Get safety information', confidence: 0.82, examples: ['Is it safe?', 'Safety tips'] }
-      ],
-      support: [
-        { name: 'get_help', description: 'Get general help', confidence: 0.90, examples: ['I need help', 'Can you help me?'] },
-        { name: 'report_issue', description: 'Report an issue', confidence: 0.88, examples: ['I have a problem', 'Something went wrong'] },
-        { name: 'contact_support', description: 'Contact support', confidence: 0.85, examples: ['Contact support', 'Speak to someone'] },
-        { name: 'feedback', description: 'Provide feedback', confidence: 0.83, examples: ['Give feedback', 'Rate experience'] }
-      ]
-    };
-
     const handleDetectIntent = useCallback(async () => {
       if (input.trim()) {
         setIsProcessing(true);
         
         // Simulate intent detection
         setTimeout(() => {
-          const allIntents = Object.values(intents).flat();
-          const randomIntent = allIntents[Math.floor(Math.random() * allIntents.length)];
+          const randomIntent = ALL_INTENTS[Math.floor(Math.random() * ALL_INTENTS.length)]!;
           
           const result = {
             intent: randomIntent.name,
             description: randomIntent.description,
             confidence: randomIntent.confidence + (Math.random() * 0.1 - 0.05),
-            category: Object.keys(intents).find(key => intents[key as keyof typeof intents].includes(randomIntent)) || 'mixed',
+            category: INTENT_CATEGORIES[randomIntent.name] || 'mixed',
             entities: [
               { type: 'destination', value: 'Paris', confidence: 0.92 },
               { type: 'date', value: '2024-06-15', confidence: 0.88 },
@@ -261,18 +291,6 @@ export const IntentRecognitionEngine = React.forwardRef<HTMLDivElement, IntentRe
       }
     }, [input, onIntentDetected]);
 
-    const getIntentIcon = (intentName: string) => {
-      if (intentName.includes('plan') || intentName.includes('trip')) return '🗺️';
-      if (intentName.includes('book')) return '📅';
-      if (intentName.includes('weather')) return '🌤️';
-      if (intentName.includes('help') || intentName.includes('support')) return '🆘';
-      if (intentName.includes('culture')) return '🏛️';
-      if (intentName.includes('transport')) return '🚌';
-      if (intentName.includes('safety')) return '🛡️';
-      if (intentName.includes('feedback')) return '💬';
-      return '🎯';
-    };
-
     const getIntentColor = (category: string) => {
       switch (category) {
         case 'travel': return 'text-blue-600 dark:text-blue-400';
@@ -80,6 +80,7 @@ export interface AuditLogger {
   log(log: AuditLog): Promise<void>;
   query(filters: AuditQueryFilters): Promise<AuditLog[]>;
   getById(id: string): Promise<AuditLog | null>;
+  flush?(): Promise<void>;
 }
 
 // Audit query filters
@@ -107,11 +108,11 @@ class FileAuditLogger implements AuditLogger {
     const logEntry = JSON.stringify({
       ...log,
       timestamp: new Date(log.timestamp).toISOString(),
-    }) + '\n';
+    });
     
     // In a real implementation, you would write to a file
     // For now, we'll just console.log
-    console.log(`[AUDIT] ${logEntry.trim()}`);
+    console.log(`[AUDIT] ${logEntry}`);
   }
   
   async query(filters: AuditQueryFilters): Promise<AuditLog[]> {
@@ -128,21 +129,135 @@ class FileAuditLogger implements AuditLogger {
   }
 }
 
+// Write-behind settings for the database audit logger
+const AUDIT_FLUSH_SIZE = 20;
+const AUDIT_FLUSH_INTERVAL_MS = 2000;
+const AUDIT_MAX_PENDING = 500;
+const AUDIT_MAX_ATTEMPTS = 3;
+
 // Database audit logger (for production)
 class DatabaseAuditLogger implements AuditLogger {
   private collection: any; // Firestore collection
+  private pending: AuditLog[] = [];
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+  private flushing: Promise<void> | null = null;
+  private failedAttempts: Map<string, number> = new Map();
   
   constructor(collection: any) {
     this.collection = collection;
   }
   
+  /**
+   * Buffer the event and persist it in a batch, off the request path
+   */
   async log(log: AuditLog): Promise<void> {
+    if (!this.collection) return;
+    
+    // Keep the buffer bounded if the database falls behind; drop the oldest event
+    if (this.pending.length >= AUDIT_MAX_PENDING) {
+      const dropped = this.pending.shift();
+      if (dropped) this.failedAttempts.delete(dropped.id);
+      console.warn('Audit buffer full, dropping oldest event');
+    }
+    
+    this.pending.push(log);
+    
+    if (this.pending.length >= AUDIT_FLUSH_SIZE) {
+      void this.flush();
+    } else if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => {
+        void this.flush();
+      }, AUDIT_FLUSH_INTERVAL_MS);
+    }
+  }
+  
+  /**
+   * Write all buffered events, one batch at a time
+   */
+  async flush(): Promise<void> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    
+    // Only one batch is written at a time; later callers wait for it, then drain the rest
+    while (this.flushing) {
+      await this.flushing;
+    }
+    
+    if (this.pending.length === 0) return;
+    
+    this.flushing = this.writeBatch();
     try {
-      if (this.collection) {
+      await this.flushing;
+    } finally {
+      this.flushing = null;
+    }
+  }
+  
+  /**
+   * Write the currently buffered events in a single batch
+   */
+  private async writeBatch(): Promise<void> {
+    const logs = this.pending;
+    this.pending = [];
+    
+    try {
+      const batch = this.collection.firestore.batch();
+      logs.forEach(log => batch.set(this.collection.doc(log.id), log));
+      await batch.commit();
+      logs.forEach(log => this.failedAttempts.delete(log.id));
+    } catch (error) {
+      console.error('Failed to log audit event batch:', error);
+      await this.writeEach(logs);
+    }
+  }
+  
+  /**
+   * Write events one by one after a failed batch, so a single rejected event can't block the rest
+   */
+  private async writeEach(logs: AuditLog[]): Promise<void> {
+    // Each write resolves to whether its event should be retried
+    const retry = await Promise.all(logs.map(async log => {
+      try {
         await this.collection.doc(log.id).set(log);
+        this.failedAttempts.delete(log.id);
+        return false;
+      } catch (error) {
+        const attempts = (this.failedAttempts.get(log.id) ?? 0) + 1;
+        if (attempts >= AUDIT_MAX_ATTEMPTS) {
+          console.error(`Failed to log audit event ${log.id}, dropping it after ${attempts} attempts:`, error);
+          this.failedAttempts.delete(log.id);
+          return false;
+        }
+        console.error('Failed to log audit event:', error);
+        this.failedAttempts.set(log.id, attempts);
+        return true;
       }
-    } catch (error) {
-      console.error('Failed to log audit event:', error);
+    }));
+    
+    const failed = logs.filter((log, index) => retry[index]);
+    if (failed.length > 0) {
+      this.requeue(failed);
+    }
+  }
+  
+  /**
+   * Put events that failed to write back in front of the buffer and retry later
+   */
+  private requeue(logs: AuditLog[]): void {
+    const combined = logs.concat(this.pending);
+    const dropped = combined.length - AUDIT_MAX_PENDING;
+    if (dropped > 0) {
+      console.warn(`Audit buffer full, dropping ${dropped} oldest events`);
+      combined.slice(0, dropped).forEach(log => this.failedAttempts.delete(log.id));
+    }
+    this.pending = dropped > 0 ? combined.slice(dropped) : combined;
+    
+    if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => {
+        void this.flush();
+      }, AUDIT_FLUSH_INTERVAL_MS);
     }
   }
   
@@ -150,6 +265,8 @@ class DatabaseAuditLogger implements AuditLogger {
     try {
       if (!this.collection) return [];
       
+      await this.flush();
+      
       let query = this.collection.orderBy('timestamp', 'desc');
       
       if (filters.userId) {
@@ -192,6 +309,8 @@ class DatabaseAuditLogger implements AuditLogger {
     try {
       if (!this.collection) return null;
       
+      await this.flush();
+      
       const doc = await this.collection.doc(id).get();
       return doc.exists ? doc.data() as AuditLog : null;
     } catch (error) {
@@ -203,15 +322,50 @@ class DatabaseAuditLogger implements AuditLogger {
 
 // Global audit logger instance
 let auditLogger: AuditLogger;
+let shutdownFlushRegistered = false;
 
 export function initializeAuditLogger(useDatabase = false, collection?: any): void {
   if (useDatabase && collection) {
     auditLogger = new DatabaseAuditLogger(collection);
+    // Only the database logger buffers events, so only it needs flushing on shutdown
+    registerShutdownFlush();
   } else {
     auditLogger = new FileAuditLogger();
   }
 }
 
+// Write out any buffered audit events
+export async function flushAuditLogger(): Promise<void> {
+  if (auditLogger?.flush) {
+    await auditLogger.flush();
+  }
+}
+
+// Flush buffered audit events when the process is about to exit
+function registerShutdownFlush(): void {
+  if (shutdownFlushRegistered || typeof process === 'undefined' || typeof process.once !== 'function') {
+    return;
+  }
+  shutdownFlushRegistered = true;
+  
+  process.once('beforeExit', () => {
+    void flushAuditLogger();
+  });
+  
+  (['SIGTERM', 'SIGINT'] as const).forEach(signal => {
+    process.once(signal, () => {
+      const terminate = () => {
+        // Re-raise the signal so the process ends with its normal signal exit code,
+        // unless another handler owns the signal
+        if (process.listenerCount(signal) === 0) {
+          process.kill(process.pid, signal);
+        }
+      };
+      flushAuditLogger().then(terminate, terminate);
+    });
+  });
+}
+
 // Audit logging functions
 export async function logAuditEvent(
   action: AuditAction,
@@ -294,7 +448,8 @@ function generateAuditId(): string {
   return `audit_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
 }
 
-function getClientIP(request: NextRequest): string {
+// Resolve the client IP from the first available source (shared with rate limiting)
+export function getClientIP(request: NextRequest): string {
   return (
     request.ip ||
     request.headers.get('x-forwarded-for') ||
@@ -323,7 +478,7 @@ export function withAuditLogging(
     } finally {
       const responseTime = Date.now() - startTime;
       
-      // Log the audit event
+      // Buffered loggers only queue the event here, so awaiting is cheap
       await logAuditEvent(action, req, {
         ...(response?.status && { responseStatus: response.status }),
         responseTime,
@@ -346,27 +501,42 @@ export function withSecurityAudit(
       
       // Check for suspicious patterns
       const userAgent = req.headers.get('user-agent') || '';
-      const ip = getClientIP(req);
       
-      // Log suspicious user agents
+      // Collect findings so each request writes at most one security event
+      const findings: Array<{
+        severity: 'low' | 'medium';
+        description: string;
+        metadata: Record<string, any>;
+      }> = [];
+      
+      // Suspicious user agents
       if (isSuspiciousUserAgent(userAgent)) {
-        await logSecurityEvent(AuditAction.SUSPICIOUS_ACTIVITY, req, {
+        findings.push({
           severity: 'medium',
           description: 'Suspicious user agent detected',
           metadata: { userAgent },
         });
       }
       
-      // Log high response times (potential DoS)
+      // High response times (potential DoS)
       const responseTime = Date.now() - startTime;
       if (responseTime > 10000) { // 10 seconds
-        await logSecurityEvent(AuditAction.SUSPICIOUS_ACTIVITY, req, {
+        findings.push({
           severity: 'low',
           description: 'Slow response time detected',
           metadata: { responseTime },
         });
       }
       
+      // Record findings before responding so the write is not left untracked
+      if (findings.length > 0) {
+        await logSecurityEvent(AuditAction.SUSPICIOUS_ACTIVITY, req, {
+          severity: findings.some(finding => finding.severity === 'medium') ? 'medium' : 'low',
+          description: findings.map(finding => finding.description).join('; '),
+          metadata: Object.assign({}, ...findings.map(finding => finding.metadata)),
+        });
+      }
+      
       return response;
     } catch (error) {
       const responseTime = Date.now() - startTime;
@@ -386,21 +556,27 @@ export function withSecurityAudit(
 }
 
 // Suspicious user agent detection
+const SUSPICIOUS_USER_AGENT_PATTERNS = [
+  /bot/i,
+  /crawler/i,
+  /spider/i,
+  /scraper/i,
+  /curl/i,
+  /wget/i,
+  /python/i,
+  /java/i,
+  /php/i,
+  /perl/i,
+];
+
+// Single alternation so each user agent is scanned once rather than once per pattern
+const SUSPICIOUS_USER_AGENT_PATTERN = new RegExp(
+  SUSPICIOUS_USER_AGENT_PATTERNS.map(pattern => `(?:${pattern.source})`).join('|'),
+  'i'
+);
+
 function isSuspiciousUserAgent(userAgent: string): boolean {
-  const suspiciousPatterns = [
-    /bot/i,
-    /crawler/i,
-    /spider/i,
-    /scraper/i,
-    /curl/i,
-    /wget/i,
-    /python/i,
-    /java/i,
-    /php/i,
-    /perl/i,
-  ];
-  
-  return suspiciousPatterns.some(pattern => pattern.test(userAgent));
+  return SUSPICIOUS_USER_AGENT_PATTERN.test(userAgent);
 }
 
 // Export audit logger instance
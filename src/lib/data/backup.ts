@@ -34,6 +34,9 @@ export interface RestoreResult {
   error?: string;
 }
 
+// Recorded on every backup and collection; fixed for the life of the process
+const BACKUP_ENVIRONMENT = process.env.NODE_ENV || 'development';
+
 export class BackupManager {
   private static instance: BackupManager;
   private db: any;
@@ -71,60 +74,60 @@ export class BackupManager {
         'migrations'
       ];
 
-      const backupData: BackupData[] = [];
-      let totalDocuments = 0;
-      let totalSize = 0;
+      // Read every collection concurrently; results keep the collection order
+      const backupData: BackupData[] = await Promise.all(
+        collections.map(async (collectionName): Promise<BackupData> => {
+          try {
+            console.log(`Backing up collection: ${collectionName}`);
+            
+            const snapshot = await this.db.collection(collectionName).get();
+            const documents = snapshot.docs.map((doc: any) => ({
+              id: doc.id,
+              ...doc.data()
+            }));
 
-      for (const collectionName of collections) {
-        try {
-          console.log(`Backing up collection: ${collectionName}`);
-          
-          const snapshot = await this.db.collection(collectionName).get();
-          const documents = snapshot.docs.map(doc => ({
-            id: doc.id,
-            ...doc.data()
-          }));
-
-          const collectionSize = JSON.stringify(documents).length;
-          totalDocuments += documents.length;
-          totalSize += collectionSize;
-
-          backupData.push({
-            collection: collectionName,
-            documents,
-            timestamp: new Date(),
-            version: this.version,
-            metadata: {
-              totalDocuments: documents.length,
-              totalSize: collectionSize,
-              collections: [collectionName],
-              environment: process.env.NODE_ENV || 'development',
-              backupType: 'full',
-            }
-          });
+            const collectionSize = JSON.stringify(documents).length;
 
-          console.log(`Backed up ${documents.length} documents from ${collectionName} (${collectionSize} bytes)`);
-        } catch (error) {
-          console.error(`Failed to backup collection ${collectionName}:`, error);
-          throw error;
-        }
-      }
+            console.log(`Backed up ${documents.length} documents from ${collectionName} (${collectionSize} bytes)`);
+
+            return {
+              collection: collectionName,
+              documents,
+              timestamp: new Date(),
+              version: this.version,
+              metadata: {
+                totalDocuments: documents.length,
+                totalSize: collectionSize,
+                collections: [collectionName],
+                environment: BACKUP_ENVIRONMENT,
+                backupType: 'full',
+              }
+            };
+          } catch (error) {
+            console.error(`Failed to backup collection ${collectionName}:`, error);
+            throw error;
+          }
+        })
+      );
+
+      const totalDocuments = backupData.reduce((sum, data) => sum + data.metadata.totalDocuments, 0);
+      const totalSize = backupData.reduce((sum, data) => sum + data.metadata.totalSize, 0);
 
       // Store backup metadata
       const metadata: BackupMetadata = {
         totalDocuments,
         totalSize,
         collections,
-        environment: process.env.NODE_ENV || 'development',
+        environment: BACKUP_ENVIRONMENT,
         backupType: 'full',
       };
 
       await this.storeBackupMetadata(backupId, metadata);
 
-      // Store backup data
-      for (const collectionBackup of backupData) {
-        await this.storeBackupData(backupId, collectionBackup);
-      }
+      // Store backup data (one independent document per collection)
+      await Promise.all(
+        backupData.map(collectionBackup => this.storeBackupData(backupId, collectionBackup))
+      );
 
       const duration = Date.now() - startTime;
       console.log(`Full backup ${backupId} completed in ${duration}ms`);
@@ -180,30 +183,31 @@ export class BackupManager {
         'travelGuides'
       ];
 
-      const backupData: BackupData[] = [];
-      let totalDocuments = 0;
-      let totalSize = 0;
-
-      for (const collectionName of collections) {
-        try {
-          console.log(`Backing up changed documents in collection: ${collectionName}`);
-          
-          // Query for documents modified since last backup
-          const snapshot = await this.db.collection(collectionName)
-            .where('updatedAt', '>', lastBackupTime)
-            .get();
-          
-          const documents = snapshot.docs.map(doc => ({
-            id: doc.id,
-            ...doc.data()
-          }));
+      // Query every collection concurrently; results keep the collection order
+      const changedCollections = await Promise.all(
+        collections.map(async (collectionName): Promise<BackupData | null> => {
+          try {
+            console.log(`Backing up changed documents in collection: ${collectionName}`);
+            
+            // Query for documents modified since last backup
+            const snapshot = await this.db.collection(collectionName)
+              .where('updatedAt', '>', lastBackupTime)
+              .get();
+            
+            const documents = snapshot.docs.map((doc: any) => ({
+              id: doc.id,
+              ...doc.data()
+            }));
+
+            if (documents.length === 0) {
+              return null;
+            }
 
-          if (documents.length > 0) {
             const collectionSize = JSON.stringify(documents).length;
-            totalDocuments += documents.length;
-            totalSize += collectionSize;
 
-            backupData.push({
+            console.log(`Backed up ${documents.length} changed documents from ${collectionName}`);
+
+            return {
               collection: collectionName,
               documents,
               timestamp: new Date(),
@@ -212,36 +216,38 @@ export class BackupManager {
                 totalDocuments: documents.length,
                 totalSize: collectionSize,
                 collections: [collectionName],
-                environment: process.env.NODE_ENV || 'development',
+                environment: BACKUP_ENVIRONMENT,
                 backupType: 'incremental',
                 previousBackupId: lastBackupId,
               }
-            });
-
-            console.log(`Backed up ${documents.length} changed documents from ${collectionName}`);
+            };
+          } catch (error) {
+            console.error(`Failed to backup collection ${collectionName}:`, error);
+            throw error;
           }
-        } catch (error) {
-          console.error(`Failed to backup collection ${collectionName}:`, error);
-          throw error;
-        }
-      }
+        })
+      );
+
+      const backupData = changedCollections.filter((data): data is BackupData => data !== null);
+      const totalDocuments = backupData.reduce((sum, data) => sum + data.metadata.totalDocuments, 0);
+      const totalSize = backupData.reduce((sum, data) => sum + data.metadata.totalSize, 0);
 
       // Store backup metadata
       const metadata: BackupMetadata = {
         totalDocuments,
         totalSize,
         collections,
-        environment: process.env.NODE_ENV || 'development',
+        environment: BACKUP_ENVIRONMENT,
         backupType: 'incremental',
         previousBackupId: lastBackupId,
       };
 
       await this.storeBackupMetadata(backupId, metadata);
 
-      // Store backup data
-      for (const collectionBackup of backupData) {
-        await this.storeBackupData(backupId, collectionBackup);
-      }
+      // Store backup data (one independent document per collection)
+      await Promise.all(
+        backupData.map(collectionBackup => this.storeBackupData(backupId, collectionBackup))
+      );
 
       const duration = Date.now() - startTime;
       console.log(`Incremental backup ${backupId} completed in ${duration}ms`);
@@ -286,13 +292,16 @@ export class BackupManager {
       }
 
       console.log(`Restoring backup: ${backupId}`);
-      let restoredDocuments = 0;
 
-      // Restore each collection
-      for (const collectionName of backupMetadata.collections) {
-        const backupDataDoc = await this.db.collection('backupData').doc(`${backupId}-${collectionName}`).get();
-        
-        if (backupDataDoc.exists) {
+      // Restore collections concurrently; each reports its own document count
+      const restoredCounts: number[] = await Promise.all(
+        backupMetadata.collections.map(async (collectionName) => {
+          const backupDataDoc = await this.db.collection('backupData').doc(`${backupId}-${collectionName}`).get();
+          
+          if (!backupDataDoc.exists) {
+            return 0;
+          }
+
           const backupData = backupDataDoc.data();
           
           // Clear existing collection (optional - be careful!)
@@ -303,13 +312,14 @@ export class BackupManager {
           for (const doc of backupData.documents) {
             const docRef = this.db.collection(collectionName).doc(doc.id);
             batch.set(docRef, doc);
-            restoredDocuments++;
           }
           
           await batch.commit();
           console.log(`Restored ${backupData.documents.length} documents to ${collectionName}`);
-        }
-      }
+          return backupData.documents.length;
+        })
+      );
+      const restoredDocuments = restoredCounts.reduce((sum, count) => sum + count, 0);
 
       const duration = Date.now() - startTime;
       console.log(`Backup ${backupId} restored successfully in ${duration}ms`);
@@ -448,13 +458,16 @@ export class BackupManager {
         return false;
       }
 
-      // Check if all collection data exists
-      for (const collectionName of backupMetadata.collections) {
-        const backupDataDoc = await this.db.collection('backupData').doc(`${backupId}-${collectionName}`).get();
-        if (!backupDataDoc.exists) {
-          console.error(`Backup data missing for collection ${collectionName}`);
-          return false;
-        }
+      // Check if all collection data exists (one batched read for every collection)
+      const backupDataRefs = backupMetadata.collections.map(collectionName =>
+        this.db.collection('backupData').doc(`${backupId}-${collectionName}`)
+      );
+      const backupDataDocs = backupDataRefs.length > 0 ? await this.db.getAll(...backupDataRefs) : [];
+
+      const missingIndex = backupDataDocs.findIndex((doc: any) => !doc.exists);
+      if (missingIndex !== -1) {
+        console.error(`Backup data missing for collection ${backupMetadata.collections[missingIndex]}`);
+        return false;
       }
 
       console.log(`Backup ${backupId} validation passed`);
@@ -49,6 +49,18 @@ const logger = winston.createLogger({
   ],
 });
 
+// Known error names mapped to app error types, resolved with a single lookup
+const NAMED_ERROR_TYPES = new Map<string, {
+  ErrorType: new (message: string, context?: ErrorContext) => BaseAppError;
+  defaultMessage: string;
+}>([
+  ['ValidationError', { ErrorType: ValidationError, defaultMessage: 'Validation error' }],
+  ['UnauthorizedError', { ErrorType: AuthenticationError, defaultMessage: 'Authentication error' }],
+  ['ForbiddenError', { ErrorType: AuthorizationError, defaultMessage: 'Authorization error' }],
+  ['NotFoundError', { ErrorType: NotFoundError, defaultMessage: 'Not found error' }],
+  ['RateLimitError', { ErrorType: RateLimitError, defaultMessage: 'Rate limit error' }],
+]);
+
 export class ErrorHandler {
   private static instance: ErrorHandler;
   private errorCounts: Map<ErrorCode, number> = new Map();
@@ -100,24 +112,12 @@ export class ErrorHandler {
     }
 
     // Handle different types of errors
-    if (error.name === 'ValidationError') {
-      return new ValidationError(error instanceof Error ? error.message : 'Validation error', context);
-    }
-    
-    if (error.name === 'UnauthorizedError') {
-      return new AuthenticationError(error instanceof Error ? error.message : 'Authentication error', context);
-    }
-    
-    if (error.name === 'ForbiddenError') {
-      return new AuthorizationError(error instanceof Error ? error.message : 'Authorization error', context);
-    }
-    
-    if (error.name === 'NotFoundError') {
-      return new NotFoundError(error instanceof Error ? error.message : 'Not found error', context);
-    }
-    
-    if (error.name === 'RateLimitError') {
-      return new RateLimitError(error instanceof Error ? error.message : 'Rate limit error', context);
+    const namedErrorType = NAMED_ERROR_TYPES.get(error.name);
+    if (namedErrorType) {
+      return new namedErrorType.ErrorType(
+        error instanceof Error ? error.message : namedErrorType.defaultMessage,
+        context
+      );
     }
 
     // Default to internal server error
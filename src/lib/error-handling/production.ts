@@ -140,6 +140,9 @@ export function withErrorHandling<T extends any[]>(
   };
 }
 
+// Methods whose requests must carry a JSON body
+const JSON_BODY_METHODS = new Set(['POST', 'PUT', 'PATCH']);
+
 // Request validation helper
 export function validateRequest(request: NextRequest, requiredFields: string[] = []) {
   const errors: string[] = [];
@@ -150,7 +153,7 @@ export function validateRequest(request: NextRequest, requiredFields: string[] =
   }
   
   // Check content type for POST/PUT requests
-  if (['POST', 'PUT', 'PATCH'].includes(request.method)) {
+  if (JSON_BODY_METHODS.has(request.method)) {
     const contentType = request.headers.get('content-type');
     if (!contentType || !contentType.includes('application/json')) {
       errors.push('Content-Type must be application/json');
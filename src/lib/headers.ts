@@ -95,8 +95,24 @@ function generateCSP(environment: 'development' | 'production'): string {
     .join('; ');
 }
 
+// Header values are static per environment, so each set is built once
+const securityHeadersCache = new Map<'development' | 'production', SecurityHeaders>();
+
+function getCachedSecurityHeaders(environment: 'development' | 'production'): SecurityHeaders {
+  let headers = securityHeadersCache.get(environment);
+  if (!headers) {
+    headers = buildSecurityHeaders(environment);
+    securityHeadersCache.set(environment, headers);
+  }
+  return headers;
+}
+
 // Security headers for different environments
 export function getSecurityHeaders(environment: 'development' | 'production' = 'production'): SecurityHeaders {
+  return { ...getCachedSecurityHeaders(environment) };
+}
+
+function buildSecurityHeaders(environment: 'development' | 'production'): SecurityHeaders {
   const isDev = environment === 'development';
   
   return {
@@ -130,7 +146,7 @@ export function applySecurityHeaders(
   response: NextResponse,
   environment: 'development' | 'production' = 'production'
 ): NextResponse {
-  const headers = getSecurityHeaders(environment);
+  const headers = getCachedSecurityHeaders(environment);
   
   Object.entries(headers).forEach(([key, value]) => {
     if (value) {
@@ -161,10 +177,13 @@ export interface CORSConfig {
   maxAge: number;
 }
 
+// Allowed origins are read from the environment once at module load
+const ALLOWED_ORIGINS: string[] = process.env.NODE_ENV === 'development'
+  ? ['http://localhost:3000', 'http://127.0.0.1:3000']
+  : process.env.ALLOWED_ORIGINS?.split(',') || [];
+
 export const CORS_CONFIG: CORSConfig = {
-  origin: process.env.NODE_ENV === 'development' 
-    ? ['http://localhost:3000', 'http://127.0.0.1:3000']
-    : process.env.ALLOWED_ORIGINS?.split(',') || [],
+  origin: ALLOWED_ORIGINS,
   methods: ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
   allowedHeaders: [
     'Content-Type',
@@ -247,11 +266,7 @@ export function withCSRFProtection(
       );
     }
     
-    const allowedOrigins = process.env.NODE_ENV === 'development'
-      ? ['http://localhost:3000', 'http://127.0.0.1:3000']
-      : process.env.ALLOWED_ORIGINS?.split(',') || [];
-    
-    const isValidOrigin = allowedOrigins.some(allowed => 
+    const isValidOrigin = ALLOWED_ORIGINS.some(allowed => 
       origin?.startsWith(allowed) || referer?.startsWith(allowed)
     );
     
@@ -7,6 +7,59 @@ export * from './rbac';
 export * from './config';
 export * from './init';
 
+// Patterns used by SecurityUtils, compiled once at module load
+const SUSPICIOUS_INPUT_PATTERNS = [
+  /<script/i,
+  /javascript:/i,
+  /on\w+\s*=/i,
+  /eval\s*\(/i,
+  /expression\s*\(/i,
+  /vbscript:/i,
+  /data:text\/html/i,
+  /data:application\/javascript/i,
+];
+
+const PRIVATE_IP_RANGES = [
+  /^10\./,
+  /^172\.(?:1[6-9]|2[0-9]|3[0-1])\./,
+  /^192\.168\./,
+  /^127\./,
+  /^::1$/,
+  /^fc00:/,
+  /^fe80:/,
+];
+
+const BOT_USER_AGENT_PATTERNS = [
+  /bot/i,
+  /crawler/i,
+  /spider/i,
+  /scraper/i,
+  /curl/i,
+  /wget/i,
+  /python/i,
+  /java/i,
+  /php/i,
+  /perl/i,
+  /go-http-client/i,
+  /okhttp/i,
+  /apache-httpclient/i,
+];
+
+// Each list is also combined into one alternation so a string is scanned once
+const SUSPICIOUS_INPUT_PATTERN = new RegExp(
+  SUSPICIOUS_INPUT_PATTERNS.map(pattern => `(?:${pattern.source})`).join('|'),
+  'i'
+);
+
+const BOT_USER_AGENT_PATTERN = new RegExp(
+  BOT_USER_AGENT_PATTERNS.map(pattern => `(?:${pattern.source})`).join('|'),
+  'i'
+);
+
+const PRIVATE_IP_PATTERN = new RegExp(
+  PRIVATE_IP_RANGES.map(range => `(?:${range.source})`).join('|')
+);
+
 // Security utilities
 export const SecurityUtils = {
   // Generate secure random strings
@@ -42,41 +95,19 @@ export const SecurityUtils = {
   
   // Check if string contains suspicious patterns
   containsSuspiciousPatterns: (input: string): boolean => {
-    const suspiciousPatterns = [
-      /<script/i,
-      /javascript:/i,
-      /on\w+\s*=/i,
-      /eval\s*\(/i,
-      /expression\s*\(/i,
-      /vbscript:/i,
-      /data:text\/html/i,
-      /data:application\/javascript/i,
-    ];
-    
-    return suspiciousPatterns.some(pattern => pattern.test(input));
+    return SUSPICIOUS_INPUT_PATTERN.test(input);
   },
   
   // Sanitize filename
   sanitizeFilename: (filename: string): string => {
     return filename
-      .replace(/[^a-zA-Z0-9.-]/g, '_')
-      .replace(/_{2,}/g, '_')
+      .replace(/[^a-zA-Z0-9.-]+/g, '_')
       .replace(/^_|_$/g, '');
   },
   
   // Check if IP is in private range
   isPrivateIP: (ip: string): boolean => {
-    const privateRanges = [
-      /^10\./,
-      /^172\.(1[6-9]|2[0-9]|3[0-1])\./,
-      /^192\.168\./,
-      /^127\./,
-      /^::1$/,
-      /^fc00:/,
-      /^fe80:/,
-    ];
-    
-    return privateRanges.some(range => range.test(ip));
+    return PRIVATE_IP_PATTERN.test(ip);
   },
   
   // Get client IP from request
@@ -93,23 +124,7 @@ export const SecurityUtils = {
   
   // Check if request is from a bot
   isBotRequest: (userAgent: string): boolean => {
-    const botPatterns = [
-      /bot/i,
-      /crawler/i,
-      /spider/i,
-      /scraper/i,
-      /curl/i,
-      /wget/i,
-      /python/i,
-      /java/i,
-      /php/i,
-      /perl/i,
-      /go-http-client/i,
-      /okhttp/i,
-      /apache-httpclient/i,
-    ];
-    
-    return botPatterns.some(pattern => pattern.test(userAgent));
+    return BOT_USER_AGENT_PATTERN.test(userAgent);
   },
   
   // Generate CSRF token
@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getToken } from 'next-auth/jwt';
 
+const AUTH_SECRET = process.env.NEXTAUTH_SECRET || 'demo-secret';
+
 export async function withAuth(
   request: NextRequest,
   handler: (request: NextRequest, token: any) => Promise<NextResponse>
@@ -8,7 +10,7 @@ export async function withAuth(
   try {
     const token = await getToken({ 
       req: request, 
-      secret: process.env.NEXTAUTH_SECRET || 'demo-secret'
+      secret: AUTH_SECRET
     });
 
     if (!token) {
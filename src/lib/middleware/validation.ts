@@ -1,5 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { ZodSchema, ZodError } from 'zod';
+import { ZodSchema } from 'zod';
 
 export function withValidation<T>(
   schema: ZodSchema<T>,
@@ -8,15 +8,13 @@ export function withValidation<T>(
   return async function validationMiddleware(request: NextRequest) {
     try {
       const body = await request.json();
-      const validatedData = schema.parse(body);
-      
-      return handler(request, validatedData);
-    } catch (error) {
-      if (error instanceof ZodError) {
+      const result = schema.safeParse(body);
+
+      if (!result.success) {
         return NextResponse.json(
           { 
             error: 'Validation failed',
-            details: error.errors.map(err => ({
+            details: result.error.errors.map(err => ({
               field: err.path.join('.'),
               message: err.message
             }))
@@ -24,7 +22,9 @@ export function withValidation<T>(
           { status: 400 }
         );
       }
-
+      
+      return handler(request, result.data);
+    } catch (error) {
       console.error('Validation middleware error:', error);
       return NextResponse.json(
         { error: 'Internal server error' },
@@ -42,15 +42,13 @@ export function withQueryValidation<T>(
     try {
       const url = new URL(request.url);
       const queryParams = Object.fromEntries(url.searchParams.entries());
-      const validatedData = schema.parse(queryParams);
-      
-      return handler(request, validatedData);
-    } catch (error) {
-      if (error instanceof ZodError) {
+      const result = schema.safeParse(queryParams);
+
+      if (!result.success) {
         return NextResponse.json(
           { 
             error: 'Query validation failed',
-            details: error.errors.map(err => ({
+            details: result.error.errors.map(err => ({
               field: err.path.join('.'),
               message: err.message
             }))
@@ -58,7 +56,9 @@ export function withQueryValidation<T>(
           { status: 400 }
         );
       }
-
+      
+      return handler(request, result.data);
+    } catch (error) {
       console.error('Query validation middleware error:', error);
       return NextResponse.json(
         { error: 'Internal server error' },
@@ -3,12 +3,16 @@
  */
 
 import { NextRequest, NextResponse } from 'next/server';
+import { createHash } from 'crypto';
+import { Redis } from 'ioredis';
+import { getRedisClient } from '@/lib/redis';
 
 export interface CacheOptions {
   ttl?: number; // Time to live in seconds
   maxSize?: number; // Maximum number of items
   strategy?: 'lru' | 'fifo' | 'ttl';
   tags?: string[]; // For cache invalidation
+  persistent?: boolean; // Mirror getOrLoad results to Redis (when REDIS_URL is set)
 }
 
 export interface CacheItem<T> {
@@ -20,11 +24,18 @@ export interface CacheItem<T> {
   lastAccessed: number;
 }
 
+// Per-cache state, kept together so each operation needs one lookup
+interface CacheStore {
+  items: Map<string, CacheItem<any>>;
+  options: CacheOptions;
+  stats: { hits: number; misses: number; evictions: number };
+}
+
 export class CacheManager {
   private static instance: CacheManager;
-  private caches: Map<string, Map<string, CacheItem<any>>> = new Map();
-  private options: Map<string, CacheOptions> = new Map();
-  private stats: Map<string, { hits: number; misses: number; evictions: number }> = new Map();
+  private caches: Map<string, CacheStore> = new Map();
+  private redis: Redis | null | undefined;
+  private inflight: Map<string, Promise<unknown>> = new Map();
 
   private constructor() {
     // Start cleanup interval
@@ -42,14 +53,16 @@ export class CacheManager {
    * Create a new cache with options
    */
   public createCache(name: string, options: CacheOptions = {}): void {
-    this.caches.set(name, new Map());
-    this.options.set(name, {
-      ttl: 300, // 5 minutes default
-      maxSize: 1000, // 1000 items default
-      strategy: 'lru',
-      ...options,
+    this.caches.set(name, {
+      items: new Map(),
+      options: {
+        ttl: 300, // 5 minutes default
+        maxSize: 1000, // 1000 items default
+        strategy: 'lru',
+        ...options,
+      },
+      stats: { hits: 0, misses: 0, evictions: 0 },
     });
-    this.stats.set(name, { hits: 0, misses: 0, evictions: 0 });
   }
 
   /**
@@ -63,7 +76,7 @@ export class CacheManager {
    * Get a cache by name
    */
   public getCache(cacheName: string): Map<string, CacheItem<any>> | null {
-    return this.caches.get(cacheName) || null;
+    return this.caches.get(cacheName)?.items || null;
   }
 
   /**
@@ -77,22 +90,23 @@ export class CacheManager {
    * Get value from cache
    */
   public get<T>(cacheName: string, key: string): T | null {
-    const cache = this.caches.get(cacheName);
-    const options = this.options.get(cacheName);
-    const stats = this.stats.get(cacheName);
+    const store = this.caches.get(cacheName);
 
-    if (!cache || !options || !stats) {
+    if (!store) {
       return null;
     }
 
+    const { items: cache, stats } = store;
     const item = cache.get(key);
     if (!item) {
       stats.misses++;
       return null;
     }
 
+    const now = Date.now();
+
     // Check if item has expired
-    if (Date.now() - item.timestamp > item.ttl * 1000) {
+    if (now - item.timestamp > item.ttl * 1000) {
       cache.delete(key);
       stats.misses++;
       return null;
@@ -100,7 +114,7 @@ export class CacheManager {
 
     // Update access statistics
     item.accessCount++;
-    item.lastAccessed = Date.now();
+    item.lastAccessed = now;
     stats.hits++;
 
     return item.value;
@@ -110,49 +124,155 @@ export class CacheManager {
    * Set value in cache
    */
   public set<T>(cacheName: string, key: string, value: T, customTtl?: number): void {
-    const cache = this.caches.get(cacheName);
-    const options = this.options.get(cacheName);
+    const store = this.caches.get(cacheName);
 
-    if (!cache || !options) {
+    if (!store) {
       return;
     }
 
+    const { items: cache, options } = store;
+
     // Check if cache is full and evict if necessary
     if (cache.size >= options.maxSize!) {
-      this.evict(cacheName);
+      this.evict(store);
     }
 
     const ttl = customTtl || options.ttl!;
+    const now = Date.now();
     const item: CacheItem<T> = {
       value,
-      timestamp: Date.now(),
+      timestamp: now,
       ttl,
       tags: options.tags || [],
       accessCount: 0,
-      lastAccessed: Date.now(),
+      lastAccessed: now,
     };
 
     cache.set(key, item);
   }
 
+  /**
+   * Get value from cache, loading and storing it on a miss.
+   * Concurrent misses for the same key share a single load.
+   * Null or undefined results, and results rejected by shouldCache, are returned but not cached.
+   */
+  public async getOrLoad<T>(
+    cacheName: string,
+    key: string,
+    loader: () => Promise<T>,
+    customTtl?: number,
+    shouldCache?: (value: T) => boolean
+  ): Promise<T> {
+    const cached = this.get<T>(cacheName, key);
+    if (cached !== null) {
+      return cached;
+    }
+
+    const inflightKey = `${cacheName}:${key}`;
+    const pending = this.inflight.get(inflightKey);
+    if (pending) {
+      return pending as Promise<T>;
+    }
+
+    const load = this.load(cacheName, key, loader, customTtl, shouldCache);
+    const release = () => {
+      this.inflight.delete(inflightKey);
+    };
+    this.inflight.set(inflightKey, load);
+    load.then(release, release);
+    return load;
+  }
+
+  /**
+   * Load a missing entry from the persistent tier or the loader, storing the result
+   */
+  private async load<T>(
+    cacheName: string,
+    key: string,
+    loader: () => Promise<T>,
+    customTtl?: number,
+    shouldCache?: (value: T) => boolean
+  ): Promise<T> {
+    const store = this.caches.get(cacheName);
+    const redis = store?.options.persistent ? this.getRedis() : null;
+    const redisKey = `cache:${cacheName}:${key}`;
+
+    if (redis) {
+      const persisted = await this.readPersistent<T>(redis, redisKey);
+      if (persisted) {
+        this.set(cacheName, key, persisted.value, persisted.ttl);
+        return persisted.value;
+      }
+    }
+
+    const value = await loader();
+    if (value !== null && value !== undefined && (!shouldCache || shouldCache(value))) {
+      this.set(cacheName, key, value, customTtl);
+      if (redis && store) {
+        this.writePersistent(redis, redisKey, value, customTtl || store.options.ttl!);
+      }
+    }
+    return value;
+  }
+
+  /**
+   * Shared Redis client for persistent caches, or null when Redis is not configured
+   */
+  private getRedis(): Redis | null {
+    if (this.redis === undefined) {
+      this.redis = process.env.REDIS_URL ? getRedisClient(process.env.REDIS_URL) : null;
+    }
+    return this.redis;
+  }
+
+  /**
+   * Read a persisted entry with its remaining TTL in seconds
+   */
+  private async readPersistent<T>(
+    redis: Redis,
+    redisKey: string
+  ): Promise<{ value: T; ttl: number } | null> {
+    try {
+      const data = await redis.get(redisKey);
+      if (!data) return null;
+
+      const { value, expiresAt } = JSON.parse(data) as { value: T; expiresAt: number };
+      const ttl = Math.ceil((expiresAt - Date.now()) / 1000);
+      return ttl > 0 ? { value, ttl } : null;
+    } catch (error) {
+      console.error('Error reading persistent cache:', error);
+      return null;
+    }
+  }
+
+  /**
+   * Persist an entry in the background; failures only cost a future miss
+   */
+  private writePersistent<T>(redis: Redis, redisKey: string, value: T, ttl: number): void {
+    const data = JSON.stringify({ value, expiresAt: Date.now() + ttl * 1000 });
+    redis.set(redisKey, data, 'EX', ttl).catch(error => {
+      console.error('Error writing persistent cache:', error);
+    });
+  }
+
   /**
    * Delete value from cache
    */
   public delete(cacheName: string, key: string): boolean {
-    const cache = this.caches.get(cacheName);
-    if (!cache) {
+    const store = this.caches.get(cacheName);
+    if (!store) {
       return false;
     }
-    return cache.delete(key);
+    return store.items.delete(key);
   }
 
   /**
    * Clear entire cache
    */
   public clear(cacheName: string): void {
-    const cache = this.caches.get(cacheName);
-    if (cache) {
-      cache.clear();
+    const store = this.caches.get(cacheName);
+    if (store) {
+      store.items.clear();
     }
   }
 
@@ -160,14 +280,15 @@ export class CacheManager {
    * Invalidate cache by tags
    */
   public invalidateByTags(cacheName: string, tags: string[]): number {
-    const cache = this.caches.get(cacheName);
+    const cache = this.caches.get(cacheName)?.items;
     if (!cache) {
       return 0;
     }
 
+    const tagSet = new Set(tags);
     let invalidated = 0;
     for (const [key, item] of Array.from(cache.entries())) {
-      if (tags.some(tag => item.tags.includes(tag))) {
+      if (item.tags.some(tag => tagSet.has(tag))) {
         cache.delete(key);
         invalidated++;
       }
@@ -180,13 +301,14 @@ export class CacheManager {
    * Get cache statistics
    */
   public getStats(cacheName: string): any {
-    const cache = this.caches.get(cacheName);
-    const stats = this.stats.get(cacheName);
+    const store = this.caches.get(cacheName);
     
-    if (!cache || !stats) {
+    if (!store) {
       return null;
     }
 
+    const { items: cache, stats } = store;
+
     const total = stats.hits + stats.misses;
     const hitRate = total > 0 ? (stats.hits / total) * 100 : 0;
 
@@ -202,15 +324,8 @@ export class CacheManager {
   /**
    * Evict items based on strategy
    */
-  private evict(cacheName: string): void {
-    const cache = this.caches.get(cacheName);
-    const options = this.options.get(cacheName);
-    const stats = this.stats.get(cacheName);
-
-    if (!cache || !options || !stats) {
-      return;
-    }
-
+  private evict(store: CacheStore): void {
+    const { items: cache, options, stats } = store;
     const items = Array.from(cache.entries());
     let itemToEvict: [string, CacheItem<any>] | null = null;
 
@@ -244,7 +359,7 @@ export class CacheManager {
   private cleanup(): void {
     const now = Date.now();
     
-    for (const [cacheName, cache] of Array.from(this.caches.entries())) {
+    for (const { items: cache } of Array.from(this.caches.values())) {
       for (const [key, item] of Array.from(cache.entries())) {
         if (now - item.timestamp > item.ttl * 1000) {
           cache.delete(key);
@@ -257,6 +372,38 @@ export class CacheManager {
 // Global cache manager instance
 export const cacheManager = CacheManager.getInstance();
 
+/**
+ * Build a fixed-length cache key from structured parameters.
+ * String values in params are trimmed, whitespace-collapsed and lower-cased so "Rome",
+ * "rome " and "ROME" share one entry; case-sensitive identifiers go in exactParams,
+ * which are hashed verbatim.
+ */
+export function createCacheKey(
+  prefix: string,
+  params: Record<string, unknown>,
+  exactParams: Record<string, unknown> = {}
+): string {
+  const normalized = Object.keys(params)
+    .sort()
+    .map(name => `${name}=${normalizeCacheKeyPart(params[name])}`)
+    .join('&');
+  const exact = Object.keys(exactParams)
+    .sort()
+    .map(name => `${name}=${encodeURIComponent(String(exactParams[name] ?? ''))}`)
+    .join('&');
+  const source = exact ? `${normalized}|${exact}` : normalized;
+  const digest = createHash('sha256').update(source).digest('hex').slice(0, 32);
+
+  return `${prefix}:${digest}`;
+}
+
+function normalizeCacheKeyPart(value: unknown): string {
+  if (value === undefined || value === null) {
+    return '';
+  }
+  return String(value).trim().replace(/\s+/g, ' ').toLowerCase();
+}
+
 /**
  * Request-based caching middleware
  */
@@ -387,10 +534,11 @@ export class CacheInvalidator {
    * Invalidate user-specific caches
    */
   public static invalidateUserCaches(userId: string): number {
+    const pattern = new RegExp(`user:${userId}`);
     let totalInvalidated = 0;
     
     for (const cacheName of cacheManager.getCacheNames()) {
-      const invalidated = this.invalidateByPattern(cacheName, new RegExp(`user:${userId}`));
+      const invalidated = this.invalidateByPattern(cacheName, pattern);
       totalInvalidated += invalidated;
     }
 
@@ -11,6 +11,7 @@ export {
   cacheManager,
   withCaching,
   cached,
+  createCacheKey,
   CacheInvalidator,
 } from './cache';
 
@@ -16,6 +16,15 @@ export interface PerformanceConfig {
   };
 }
 
+// Route matchers, compiled once so each check is a single anchored scan
+const STATIC_CONTENT_PATTERN = /^\/(?:_next\/)?static\/|\.(?:js|css|png|jpg|jpeg|gif|ico|svg|woff|woff2|ttf|eot)$/;
+const PROTECTED_API_ROUTE_PATTERN = /^\/api\/(?:chat|itineraries|users|admin)/;
+const PUBLIC_CACHEABLE_API_ROUTE_PATTERN = /^\/api\/(?:health|metrics|weather|countries)/;
+const COMPRESSIBLE_CONTENT_TYPE_PATTERN = /application\/(?:json|javascript)|text\/(?:css|html|plain|xml)/;
+
+// Fields callers may sort query results by
+const SORTABLE_FIELDS: ReadonlySet<string> = new Set(['createdAt', 'updatedAt', 'title', 'destination', 'status']);
+
 export class PerformanceOptimizer {
   private static instance: PerformanceOptimizer;
   private config: PerformanceConfig;
@@ -80,10 +89,7 @@ export class PerformanceOptimizer {
    * Check if content is static
    */
   private isStaticContent(request: NextRequest): boolean {
-    const pathname = request.nextUrl.pathname;
-    return pathname.startsWith('/_next/static/') || 
-           pathname.startsWith('/static/') ||
-           /\.(js|css|png|jpg|jpeg|gif|ico|svg|woff|woff2|ttf|eot)$/.test(pathname);
+    return STATIC_CONTENT_PATTERN.test(request.nextUrl.pathname);
   }
 
   /**
@@ -99,33 +105,19 @@ export class PerformanceOptimizer {
     }
 
     // Don't cache API routes that require authentication
-    if (pathname.startsWith('/api/') && this.requiresAuth(pathname)) {
+    if (this.requiresAuth(pathname)) {
       return false;
     }
 
     // Cache public API routes
-    if (pathname.startsWith('/api/health') || 
-        pathname.startsWith('/api/metrics') ||
-        pathname.startsWith('/api/weather') ||
-        pathname.startsWith('/api/countries')) {
-      return true;
-    }
-
-    return false;
+    return PUBLIC_CACHEABLE_API_ROUTE_PATTERN.test(pathname);
   }
 
   /**
    * Check if API route requires authentication
    */
   private requiresAuth(pathname: string): boolean {
-    const protectedRoutes = [
-      '/api/chat',
-      '/api/itineraries',
-      '/api/users',
-      '/api/admin',
-    ];
-    
-    return protectedRoutes.some(route => pathname.startsWith(route));
+    return PROTECTED_API_ROUTE_PATTERN.test(pathname);
   }
 
   /**
@@ -133,7 +125,6 @@ export class PerformanceOptimizer {
    */
   private shouldCompress(request: NextRequest, response: NextResponse): boolean {
     const acceptEncoding = request.headers.get('accept-encoding') || '';
-    const contentType = response.headers.get('content-type') || '';
     
     // Check if client supports compression
     if (!acceptEncoding.includes('gzip')) {
@@ -141,16 +132,8 @@ export class PerformanceOptimizer {
     }
 
     // Check if content type is compressible
-    const compressibleTypes = [
-      'application/json',
-      'application/javascript',
-      'text/css',
-      'text/html',
-      'text/plain',
-      'text/xml',
-    ];
-
-    return compressibleTypes.some(type => contentType.includes(type));
+    const contentType = response.headers.get('content-type') || '';
+    return COMPRESSIBLE_CONTENT_TYPE_PATTERN.test(contentType);
   }
 
   /**
@@ -247,8 +230,7 @@ export class QueryOptimizer {
    * Optimize sort parameters
    */
   public static optimizeSort(sortBy?: string, sortOrder?: string): { field: string; order: 'asc' | 'desc' } {
-    const allowedFields = ['createdAt', 'updatedAt', 'title', 'destination', 'status'];
-    const field = allowedFields.includes(sortBy || '') ? sortBy! : 'createdAt';
+    const field = sortBy && SORTABLE_FIELDS.has(sortBy) ? sortBy : 'createdAt';
     const order = sortOrder === 'desc' ? 'desc' : 'asc';
     
     return { field, order };
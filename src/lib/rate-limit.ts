@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { Redis } from 'ioredis';
+import { getClientIP } from './audit';
+import { getRedisClient } from './redis';
 
 // Rate limiting configuration
 export interface RateLimitConfig {
@@ -110,36 +112,68 @@ class RedisStore {
   private redis: Redis;
   
   constructor(redisUrl?: string) {
-    this.redis = new Redis(redisUrl || process.env.REDIS_URL || 'redis://localhost:6379');
+    this.redis = getRedisClient(redisUrl || process.env.REDIS_URL || 'redis://localhost:6379');
   }
   
+  // Counters are stored as plain integers with a key TTL, so no JSON round-trip is needed
   async get(key: string): Promise<{ count: number; resetTime: number } | null> {
-    const data = await this.redis.get(key);
-    if (!data) return null;
+    const results = await this.redis.multi().get(key).pttl(key).exec();
+    const error = results?.map(([commandError]) => commandError).find(Boolean);
+    if (error) throw error;
     
-    return JSON.parse(data);
+    const count = results?.[0]?.[1] as string | null | undefined;
+    const ttl = results?.[1]?.[1] as number | undefined;
+    const parsed = count ? parseInt(count, 10) : NaN;
+    // Missing keys and counters in the previous JSON format read as no counter
+    if (isNaN(parsed)) return null;
+    
+    return {
+      count: parsed,
+      resetTime: Date.now() + Math.max(ttl ?? 0, 0),
+    };
   }
   
   async set(key: string, count: number, windowMs: number): Promise<void> {
-    const data = JSON.stringify({
-      count,
-      resetTime: Date.now() + windowMs,
-    });
-    
-    await this.redis.setex(key, Math.ceil(windowMs / 1000), data);
+    await this.redis.psetex(key, windowMs, count.toString());
   }
   
-  async increment(key: string, windowMs: number): Promise<{ count: number; resetTime: number }> {
-    const existing = await this.get(key);
+  // SET ... NX starts the window only for a new counter and INCR keeps the TTL,
+  // so the counter and its expiry are created together in one transaction
+  async increment(
+    key: string,
+    windowMs: number,
+    isRetry = false
+  ): Promise<{ count: number; resetTime: number }> {
+    const results = await this.redis
+      .multi()
+      .set(key, '0', 'PX', windowMs, 'NX')
+      .incr(key)
+      .pttl(key)
+      .exec();
+    if (!results) {
+      throw new Error(`Rate limit transaction aborted for ${key}`);
+    }
     
-    if (!existing) {
-      await this.set(key, 1, windowMs);
-      return { count: 1, resetTime: Date.now() + windowMs };
+    const error = results.map(([commandError]) => commandError).find(Boolean);
+    if (error) {
+      // Counters stored as JSON by the previous format can't be incremented; reset them once
+      if (!isRetry && /not an integer/i.test(error.message)) {
+        await this.redis.del(key);
+        return this.increment(key, windowMs, true);
+      }
+      throw error;
     }
     
-    const newCount = existing.count + 1;
-    await this.set(key, newCount, windowMs);
-    return { count: newCount, resetTime: existing.resetTime };
+    const count = results[1]?.[1] as number;
+    const ttl = results[2]?.[1] as number;
+    
+    // Repair counters left without an expiry, so a client can't stay limited forever
+    if (ttl < 0) {
+      await this.redis.pexpire(key, windowMs);
+      return { count, resetTime: Date.now() + windowMs };
+    }
+    
+    return { count, resetTime: Date.now() + ttl };
   }
 }
 
@@ -187,8 +221,7 @@ const rateLimiter = new RateLimiter(process.env.NODE_ENV === 'production' || pro
 export const keyGenerators = {
   // IP-based key
   ip: (req: NextRequest) => {
-    const ip = req.ip || req.headers.get('x-forwarded-for') || req.headers.get('x-real-ip') || 'unknown';
-    return `rate_limit:ip:${ip}`;
+    return `rate_limit:ip:${getClientIP(req)}`;
   },
   
   // User-based key
@@ -199,14 +232,14 @@ export const keyGenerators = {
   
   // IP + User combination
   ipUser: (req: NextRequest) => {
-    const ip = req.ip || req.headers.get('x-forwarded-for') || req.headers.get('x-real-ip') || 'unknown';
+    const ip = getClientIP(req);
     const userId = req.headers.get('x-user-id') || 'anonymous';
     return `rate_limit:ip_user:${ip}:${userId}`;
   },
   
   // Endpoint-specific key
   endpoint: (req: NextRequest) => {
-    const ip = req.ip || req.headers.get('x-forwarded-for') || req.headers.get('x-real-ip') || 'unknown';
+    const ip = getClientIP(req);
     const endpoint = req.nextUrl.pathname;
     return `rate_limit:endpoint:${endpoint}:${ip}`;
   },
@@ -120,6 +120,17 @@ export const ROLE_PERMISSIONS: Record<UserRole, Permission[]> = {
   ],
 };
 
+// Permission lookups are built once so checks are constant-time
+const ROLE_PERMISSION_SETS = Object.fromEntries(
+  Object.entries(ROLE_PERMISSIONS).map(([role, permissions]) => [role, new Set(permissions)])
+) as Record<UserRole, ReadonlySet<Permission>>;
+
+// Some permissions allow access to other users' resources
+const CROSS_USER_PERMISSIONS: ReadonlySet<Permission> = new Set([
+  Permission.READ_ITINERARY,
+  Permission.READ_CHAT,
+]);
+
 // Resource ownership check
 export interface ResourceOwnership {
   userId: string;
@@ -164,22 +175,29 @@ export class RBACService {
     return this.userPermissions.get(userId) || [];
   }
   
+  // Get user permissions as a set for membership checks
+  private getUserPermissionSet(userId: string): ReadonlySet<Permission> | null {
+    const role = this.userRoles.get(userId);
+    return role ? ROLE_PERMISSION_SETS[role] : null;
+  }
+  
   // Check if user has permission
   hasPermission(userId: string, permission: Permission): boolean {
-    const permissions = this.getUserPermissions(userId);
-    return permissions.includes(permission);
+    const permissions = this.getUserPermissionSet(userId);
+    return permissions ? permissions.has(permission) : false;
   }
   
   // Check if user has any of the permissions
   hasAnyPermission(userId: string, permissions: Permission[]): boolean {
-    const userPermissions = this.getUserPermissions(userId);
-    return permissions.some(permission => userPermissions.includes(permission));
+    const userPermissions = this.getUserPermissionSet(userId);
+    return !!userPermissions && permissions.some(permission => userPermissions.has(permission));
   }
   
   // Check if user has all permissions
   hasAllPermissions(userId: string, permissions: Permission[]): boolean {
-    const userPermissions = this.getUserPermissions(userId);
-    return permissions.every(permission => userPermissions.includes(permission));
+    const userPermissions = this.getUserPermissionSet(userId);
+    if (!userPermissions) return permissions.length === 0;
+    return permissions.every(permission => userPermissions.has(permission));
   }
   
   // Check resource ownership
@@ -216,13 +234,7 @@ export class RBACService {
     
     // Check resource ownership for user-level resources
     if (resource && !this.isResourceOwner(userId, resource)) {
-      // Some permissions allow access to other users' resources
-      const crossUserPermissions = [
-        Permission.READ_ITINERARY,
-        Permission.READ_CHAT,
-      ];
-      
-      if (!crossUserPermissions.includes(permission)) {
+      if (!CROSS_USER_PERMISSIONS.has(permission)) {
         return {
           allowed: false,
           reason: 'User does not own this resource',
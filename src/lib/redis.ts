@@ -0,0 +1,17 @@
+/**
+ * Shared Redis connections
+ */
+
+import { Redis } from 'ioredis';
+
+// One client per URL, reused by the cache and rate limiter
+const redisClients = new Map<string, Redis>();
+
+export function getRedisClient(redisUrl: string): Redis {
+  let client = redisClients.get(redisUrl);
+  if (!client) {
+    client = new Redis(redisUrl);
+    redisClients.set(redisUrl, client);
+  }
+  return client;
+}
@@ -34,10 +34,10 @@ export class AISecurityManager {
     // Command injection patterns
     /; rm -rf/i,
     /&& rm -rf/i,
-    /| rm -rf/i,
+    /\| rm -rf/i,
     /cat \/etc\/passwd/i,
     /whoami/i,
-    /id/i,
+    /\bid\b/i,
     
     // Data exfiltration patterns
     /show me all users/i,
@@ -51,6 +51,11 @@ export class AISecurityManager {
     /roleplay as/i,
     /you are now/i,
   ];
+  // All DANGEROUS_PATTERNS in one alternation, used as a single-scan gate
+  private static readonly DANGEROUS_PATTERN = new RegExp(
+    AISecurityManager.DANGEROUS_PATTERNS.map(pattern => `(?:${pattern.source})`).join('|'),
+    'i'
+  );
 
   private static readonly MAX_PROMPT_LENGTH = 4000;
   private static readonly MAX_RESPONSE_LENGTH = 8000;
@@ -60,6 +65,31 @@ export class AISecurityManager {
     'database', 'sql', 'query', 'table', 'user',
     'system', 'config', 'environment', 'variable'
   ];
+  // Single-pass scanner for SUSPICIOUS_KEYWORDS and their plurals, compiled once.
+  // Letter boundaries rather than \b, so identifiers like db_password and API_KEY still match.
+  private static readonly SUSPICIOUS_KEYWORD_PATTERN = new RegExp(
+    `(?<![a-z])(${AISecurityManager.SUSPICIOUS_KEYWORDS.join('|')})s?(?![a-z])`,
+    'gi'
+  );
+  // Expected shape of AI-generated itineraries, built once rather than per validation
+  private static readonly ITINERARY_SCHEMA = z.object({
+    title: z.string().max(200),
+    destination: z.string().max(100),
+    days: z.array(z.object({
+      activities: z.array(z.object({
+        name: z.string().max(200),
+        description: z.string().max(1000),
+        location: z.object({
+          name: z.string().max(200),
+          address: z.string().max(500),
+          coordinates: z.object({
+            lat: z.number().min(-90).max(90),
+            lng: z.number().min(-180).max(180),
+          }),
+        }),
+      })),
+    })),
+  });
 
   /**
    * Sanitize user input before sending to AI
@@ -73,19 +103,19 @@ export class AISecurityManager {
     let sanitized = userInput;
     let blocked = false;
 
-    // Check for dangerous patterns
-    for (const pattern of this.DANGEROUS_PATTERNS) {
-      if (pattern.test(sanitized)) {
-        warnings.push(`Blocked potentially dangerous pattern: ${pattern.source}`);
-        sanitized = sanitized.replace(pattern, '[REDACTED]');
-        blocked = true;
+    // Check for dangerous patterns (individual patterns only run on a gate hit)
+    if (this.DANGEROUS_PATTERN.test(sanitized)) {
+      for (const pattern of this.DANGEROUS_PATTERNS) {
+        if (pattern.test(sanitized)) {
+          warnings.push(`Blocked potentially dangerous pattern: ${pattern.source}`);
+          sanitized = sanitized.replace(pattern, '[REDACTED]');
+          blocked = true;
+        }
       }
     }
 
     // Check for suspicious keywords in context
-    const suspiciousCount = this.SUSPICIOUS_KEYWORDS.filter(keyword => 
-      sanitized.toLowerCase().includes(keyword)
-    ).length;
+    const suspiciousCount = this.countSuspiciousKeywords(sanitized);
 
     if (suspiciousCount > 3) {
       warnings.push('High number of suspicious keywords detected');
@@ -107,6 +137,21 @@ export class AISecurityManager {
     };
   }
 
+  /**
+   * Count distinct suspicious keywords, including plural forms, in a single scan of the input
+   */
+  private static countSuspiciousKeywords(input: string): number {
+    const pattern = this.SUSPICIOUS_KEYWORD_PATTERN;
+    const keywords = new Set<string>();
+    let match: RegExpExecArray | null;
+    
+    pattern.lastIndex = 0;
+    while ((match = pattern.exec(input)) !== null) {
+      keywords.add(match[1]!.toLowerCase());
+    }
+    return keywords.size;
+  }
+
   /**
    * Validate AI response for security issues
    */
@@ -119,12 +164,14 @@ export class AISecurityManager {
     let sanitized = response;
     let valid = true;
 
-    // Check for dangerous patterns in response
-    for (const pattern of this.DANGEROUS_PATTERNS) {
-      if (pattern.test(sanitized)) {
-        warnings.push(`AI response contains dangerous pattern: ${pattern.source}`);
-        sanitized = sanitized.replace(pattern, '[FILTERED]');
-        valid = false;
+    // Check for dangerous patterns in response (individual patterns only run on a gate hit)
+    if (this.DANGEROUS_PATTERN.test(sanitized)) {
+      for (const pattern of this.DANGEROUS_PATTERNS) {
+        if (pattern.test(sanitized)) {
+          warnings.push(`AI response contains dangerous pattern: ${pattern.source}`);
+          sanitized = sanitized.replace(pattern, '[FILTERED]');
+          valid = false;
+        }
       }
     }
 
@@ -188,28 +235,10 @@ export class AISecurityManager {
     let valid = true;
 
     // Validate itinerary structure
-    const itinerarySchema = z.object({
-      title: z.string().max(200),
-      destination: z.string().max(100),
-      days: z.array(z.object({
-        activities: z.array(z.object({
-          name: z.string().max(200),
-          description: z.string().max(1000),
-          location: z.object({
-            name: z.string().max(200),
-            address: z.string().max(500),
-            coordinates: z.object({
-              lat: z.number().min(-90).max(90),
-              lng: z.number().min(-180).max(180),
-            }),
-          }),
-        })),
-      })),
-    });
-
-    try {
-      sanitized = itinerarySchema.parse(itinerary);
-    } catch (error) {
+    const parsed = this.ITINERARY_SCHEMA.safeParse(itinerary);
+    if (parsed.success) {
+      sanitized = parsed.data;
+    } else {
       warnings.push('Invalid itinerary structure');
       valid = false;
     }
@@ -34,6 +34,7 @@ export interface SecurityAuditConfig {
   enabled: boolean;
   logLevel: 'low' | 'medium' | 'high' | 'critical';
   retentionDays: number;
+  maxEvents?: number; // Upper bound on events held in memory
   alertThresholds: {
     failedLogins: number;
     suspiciousActivity: number;
@@ -43,8 +44,9 @@ export interface SecurityAuditConfig {
 
 export const defaultAuditConfig: SecurityAuditConfig = {
   enabled: process.env.NODE_ENV === 'production',
-  logLevel: 'medium',
+  logLevel: 'low',
   retentionDays: 90,
+  maxEvents: 10000,
   alertThresholds: {
     failedLogins: 5,
     suspiciousActivity: 3,
@@ -52,6 +54,17 @@ export const defaultAuditConfig: SecurityAuditConfig = {
   },
 };
 
+// Severity ranks used to compare events against the configured log level
+const SEVERITY_RANK: Record<SecurityAuditEvent['severity'], number> = {
+  low: 0,
+  medium: 1,
+  high: 2,
+  critical: 3,
+};
+
+// Fraction of maxEvents dropped at once when the in-memory history overflows
+const AUDIT_TRIM_RATIO = 0.1;
+
 export class SecurityAuditor {
   private config: SecurityAuditConfig;
   private events: SecurityAuditEvent[] = [];
@@ -68,16 +81,28 @@ export class SecurityAuditor {
       return;
     }
 
+    const now = Date.now();
     const auditEvent: SecurityAuditEvent = {
       ...event,
-      id: this.generateEventId(),
-      timestamp: new Date(),
+      id: this.generateEventId(now),
+      timestamp: new Date(now),
     };
 
     this.events.push(auditEvent);
+
+    // Keep the in-memory history bounded, dropping the oldest events in chunks
+    // so the array isn't shifted on every push once the cap is reached
+    const maxEvents = this.config.maxEvents ?? defaultAuditConfig.maxEvents!;
+    if (this.events.length > maxEvents) {
+      const trimCount = this.events.length - maxEvents + Math.ceil(maxEvents * AUDIT_TRIM_RATIO);
+      this.events.splice(0, trimCount);
+    }
     
     // In production, this would send to a proper logging service
-    console.log('Security Audit Event:', auditEvent);
+    // Events below the configured log level are kept in memory but not written out
+    if (SEVERITY_RANK[auditEvent.severity] >= SEVERITY_RANK[this.config.logLevel]) {
+      console.log('Security Audit Event:', auditEvent);
+    }
   }
 
   /**
@@ -218,18 +243,25 @@ export class SecurityAuditor {
    * Check for suspicious activity
    */
   checkSuspiciousActivity(userId: string, timeWindowMinutes: number = 60): boolean {
-    const cutoffTime = new Date(Date.now() - timeWindowMinutes * 60 * 1000);
-    const recentEvents = this.events.filter(
-      event => event.userId === userId && event.timestamp > cutoffTime
-    );
+    const cutoffTime = Date.now() - timeWindowMinutes * 60 * 1000;
+    let failedLogins = 0;
+    let accessDenied = 0;
 
-    const failedLogins = recentEvents.filter(
-      event => event.type === 'authentication' && !event.success
-    ).length;
-
-    const accessDenied = recentEvents.filter(
-      event => event.type === 'authorization' && !event.success
-    ).length;
+    // Events are stored oldest first, so walk back until the window closes
+    for (let i = this.events.length - 1; i >= 0; i--) {
+      const event = this.events[i]!;
+      if (event.timestamp.getTime() <= cutoffTime) {
+        break;
+      }
+      if (event.userId !== userId || event.success) {
+        continue;
+      }
+      if (event.type === 'authentication') {
+        failedLogins++;
+      } else if (event.type === 'authorization') {
+        accessDenied++;
+      }
+    }
 
     return failedLogins >= this.config.alertThresholds.failedLogins ||
            accessDenied >= this.config.alertThresholds.suspiciousActivity;
@@ -238,16 +270,16 @@ export class SecurityAuditor {
   /**
    * Generate unique event ID
    */
-  private generateEventId(): string {
-    return `audit_${Date.now()}_${Math.random().toString(36).substring(2, 15)}`;
+  private generateEventId(now: number): string {
+    return `audit_${now}_${Math.random().toString(36).substring(2, 15)}`;
   }
 
   /**
    * Clean up old events
    */
   cleanup(): void {
-    const cutoffDate = new Date(Date.now() - this.config.retentionDays * 24 * 60 * 60 * 1000);
-    this.events = this.events.filter(event => event.timestamp > cutoffDate);
+    const cutoffTime = Date.now() - this.config.retentionDays * 24 * 60 * 60 * 1000;
+    this.events = this.events.filter(event => event.timestamp.getTime() > cutoffTime);
   }
 }
 
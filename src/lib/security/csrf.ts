@@ -1,6 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { randomBytes, createHmac } from 'crypto';
 
+// Endpoints exempt from CSRF checks, matched in one anchored scan
+const CSRF_EXEMPT_PATH_PATTERN = /^\/api\/(?:health|metrics|weather)/;
+
 export interface CSRFConfig {
   secret: string;
   tokenLength: number;
@@ -55,7 +58,7 @@ export class CSRFProtection {
         return false;
       }
 
-      const [randomToken, timestamp, tokenSessionId, signature] = parts;
+      const [, timestamp, tokenSessionId] = parts;
       
       // Check if token is expired
       const tokenAge = Date.now() - parseInt(timestamp);
@@ -63,22 +66,20 @@ export class CSRFProtection {
         return false;
       }
 
-      // Verify signature
-      const data = `${randomToken}:${timestamp}:${tokenSessionId}`;
-      const expectedSignature = createHmac('sha256', this.config.secret)
-        .update(data)
-        .digest('hex');
-      
-      if (signature !== expectedSignature) {
-        return false;
-      }
-
       // Verify session ID if provided
       if (sessionId && tokenSessionId !== sessionId) {
         return false;
       }
 
-      return true;
+      // Verify signature over the signed prefix exactly as generated
+      const signatureIndex = token.lastIndexOf(':');
+      const data = token.slice(0, signatureIndex);
+      const signature = token.slice(signatureIndex + 1);
+      const expectedSignature = createHmac('sha256', this.config.secret)
+        .update(data)
+        .digest('hex');
+      
+      return signature === expectedSignature;
     } catch (error) {
       console.error('CSRF token verification error:', error);
       return false;
@@ -128,9 +129,7 @@ export class CSRFProtection {
       }
 
       // Skip CSRF for public endpoints
-      const pathname = req.nextUrl.pathname;
-      const publicPaths = ['/api/health', '/api/metrics', '/api/weather'];
-      if (publicPaths.some(path => pathname.startsWith(path))) {
+      if (CSRF_EXEMPT_PATH_PATTERN.test(req.nextUrl.pathname)) {
         return handler(req, context);
       }
 
@@ -1,5 +1,16 @@
 import { NextRequest, NextResponse } from 'next/server';
 
+// Content Security Policy, joined once at module load
+const CONTENT_SECURITY_POLICY = [
+  "default-src 'self'",
+  "script-src 'self' 'unsafe-eval' 'unsafe-inline' https://www.gstatic.com https://www.google.com",
+  "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com",
+  "img-src 'self' data: https: blob:",
+  "font-src 'self' https://fonts.gstatic.com",
+  "connect-src 'self' https://*.googleapis.com https://*.firebaseio.com https://*.firebaseapp.com wss://*.firebaseio.com",
+  "frame-src 'self' https://*.google.com",
+].join('; ');
+
 // Security headers middleware
 export function securityHeaders(request: NextRequest) {
   const response = NextResponse.next();
@@ -11,17 +22,7 @@ export function securityHeaders(request: NextRequest) {
   response.headers.set('Referrer-Policy', 'strict-origin-when-cross-origin');
   
   // Content Security Policy
-  const csp = [
-    "default-src 'self'",
-    "script-src 'self' 'unsafe-eval' 'unsafe-inline' https://www.gstatic.com https://www.google.com",
-    "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com",
-    "img-src 'self' data: https: blob:",
-    "font-src 'self' https://fonts.gstatic.com",
-    "connect-src 'self' https://*.googleapis.com https://*.firebaseio.com https://*.firebaseapp.com wss://*.firebaseio.com",
-    "frame-src 'self' https://*.google.com",
-  ].join('; ');
-  
-  response.headers.set('Content-Security-Policy', csp);
+  response.headers.set('Content-Security-Policy', CONTENT_SECURITY_POLICY);
   
   // HSTS for production
   if (process.env.NODE_ENV === 'production') {
@@ -223,6 +223,39 @@ interface RadarData {
   coverage: number;
 }
 
+// Compass points and UV bands are fixed, so they are built once per module
+const WIND_DIRECTIONS = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE', 'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW'];
+
+interface UVIndexLevel {
+  max: number;
+  label: string;
+  className: string;
+}
+
+const EXTREME_UV_INDEX_LEVEL: UVIndexLevel = {
+  max: Infinity,
+  label: 'Extreme',
+  className: 'text-purple-600 dark:text-purple-400'
+};
+
+const UV_INDEX_LEVELS: UVIndexLevel[] = [
+  { max: 2, label: 'Low', className: 'text-green-600 dark:text-green-400' },
+  { max: 5, label: 'Moderate', className: 'text-yellow-600 dark:text-yellow-400' },
+  { max: 7, label: 'High', className: 'text-orange-600 dark:text-orange-400' },
+  { max: 10, label: 'Very High', className: 'text-red-600 dark:text-red-400' }
+];
+
+const getWindDirection = (degrees: number) => {
+  return WIND_DIRECTIONS[Math.round(degrees / 22.5) % 16];
+};
+
+const getUVIndexLevel = (index: number): UVIndexLevel => {
+  for (const level of UV_INDEX_LEVELS) {
+    if (index <= level.max) return level;
+  }
+  return EXTREME_UV_INDEX_LEVEL;
+};
+
 // Weather Information Component
 export const WeatherInformation = React.forwardRef<HTMLDivElement, WeatherInformationProps>(
   ({ 
@@ -449,27 +482,6 @@ export const WeatherInformation = React.forwardRef<HTMLDivElement, WeatherInform
       return `${visibility} km`;
     };
 
-    const getWindDirection = (degrees: number) => {
-      const directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE', 'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW'];
-      return directions[Math.round(degrees / 22.5) % 16];
-    };
-
-    const getUVIndexColor = (index: number) => {
-      if (index <= 2) return 'text-green-600 dark:text-green-400';
-      if (index <= 5) return 'text-yellow-600 dark:text-yellow-400';
-      if (index <= 7) return 'text-orange-600 dark:text-orange-400';
-      if (index <= 10) return 'text-red-600 dark:text-red-400';
-      return 'text-purple-600 dark:text-purple-400';
-    };
-
-    const getUVIndexDescription = (index: number) => {
-      if (index <= 2) return 'Low';
-      if (index <= 5) return 'Moderate';
-      if (index <= 7) return 'High';
-      if (index <= 10) return 'Very High';
-      return 'Extreme';
-    };
-
     const getAlertColor = (severity: WeatherAlert['severity']) => {
       switch (severity) {
         case 'minor': return 'bg-blue-100 text-blue-800 dark:bg-blue-900 dark:text-blue-200';
@@ -581,8 +593,8 @@ export const WeatherInformation = React.forwardRef<HTMLDivElement, WeatherInform
                 </div>
                 <div className="flex justify-between">
                   <span className="text-gray-600 dark:text-gray-400">UV Index:</span>
-                  <span className={cn('font-medium', getUVIndexColor(weather.current.uvIndex))}>
-                    {weather.current.uvIndex} ({getUVIndexDescription(weather.current.uvIndex)})
+                  <span className={cn('font-medium', getUVIndexLevel(weather.current.uvIndex).className)}>
+                    {weather.current.uvIndex} ({getUVIndexLevel(weather.current.uvIndex).label})
                   </span>
                 </div>
               </div>
@@ -405,6 +405,10 @@ export const BudgetManagement = React.forwardRef<HTMLDivElement, BudgetManagemen
       }
     }, [budget.categories.length, initializeCategories]);
 
+    // Derived once per render instead of inside the markup
+    const spentRatio = budget.totalBudget > 0 ? budget.spentAmount / budget.totalBudget : 0;
+    const unreadAlertCount = budget.alerts.filter(a => !a.isRead).length;
+
     return (
       <div
         ref={ref}
@@ -471,7 +475,7 @@ export const BudgetManagement = React.forwardRef<HTMLDivElement, BudgetManagemen
               Budget Progress
             </span>
             <span className="text-sm text-gray-600 dark:text-gray-400">
-              {budget.totalBudget > 0 ? Math.round((budget.spentAmount / budget.totalBudget) * 100) : 0}%
+              {Math.round(spentRatio * 100)}%
             </span>
           </div>
           <div className="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
@@ -484,11 +488,7 @@ export const BudgetManagement = React.forwardRef<HTMLDivElement, BudgetManagemen
                     ? 'bg-orange-500' 
                     : 'bg-green-500'
               )}
-              style={{ 
-                width: budget.totalBudget > 0 
-                  ? `${Math.min((budget.spentAmount / budget.totalBudget) * 100, 100)}%` 
-                  : '0%' 
-              }}
+              style={{ width: `${Math.min(spentRatio * 100, 100)}%` }}
             />
           </div>
         </div>
@@ -508,9 +508,9 @@ export const BudgetManagement = React.forwardRef<HTMLDivElement, BudgetManagemen
             >
               <span>{tab.icon}</span>
               <span>{tab.name}</span>
-              {tab.id === 'alerts' && budget.alerts.filter(a => !a.isRead).length > 0 && (
+              {tab.id === 'alerts' && unreadAlertCount > 0 && (
                 <span className="px-2 py-1 text-xs bg-red-100 text-red-800 dark:bg-red-900 dark:text-red-200 rounded-full">
-                  {budget.alerts.filter(a => !a.isRead).length}
+                  {unreadAlertCount}
                 </span>
               )}
             </button>
@@ -10,7 +10,7 @@
 
 'use client';
 
-import React, { useState, useEffect, useCallback, useRef } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { cva, type VariantProps } from 'class-variance-authority';
 import { cn } from '@/lib/utils';
 
@@ -452,6 +452,25 @@ export const PackingLists = React.forwardRef<HTMLDivElement, PackingListsProps>(
       }
     }, [packing.lists, calculateCompletionPercentage, updatePacking]);
 
+    // Aggregate the header stats in a single walk over the lists
+    const packingStats = useMemo(() => {
+      let totalItems = 0;
+      let packedItems = 0;
+      let completionSum = 0;
+      packing.lists.forEach(list => {
+        totalItems += list.items.length;
+        completionSum += list.completionPercentage;
+        list.items.forEach(item => {
+          if (item.isPacked) packedItems++;
+        });
+      });
+      return {
+        totalItems,
+        packedItems,
+        averageCompletion: packing.lists.length > 0 ? Math.round(completionSum / packing.lists.length) : 0,
+      };
+    }, [packing.lists]);
+
     return (
       <div
         ref={ref}
@@ -496,21 +515,21 @@ export const PackingLists = React.forwardRef<HTMLDivElement, PackingListsProps>(
           
           <div className="bg-white dark:bg-gray-800 border border-gray-200 dark:border-gray-600 rounded-lg p-4 text-center">
             <div className="text-2xl font-bold text-green-600 dark:text-green-400">
-              {packing.lists.reduce((total, list) => total + list.items.length, 0)}
+              {packingStats.totalItems}
             </div>
             <div className="text-sm text-gray-600 dark:text-gray-400">Total Items</div>
           </div>
           
           <div className="bg-white dark:bg-gray-800 border border-gray-200 dark:border-gray-600 rounded-lg p-4 text-center">
             <div className="text-2xl font-bold text-purple-600 dark:text-purple-400">
-              {packing.lists.reduce((total, list) => total + list.items.filter(item => item.isPacked).length, 0)}
+              {packingStats.packedItems}
             </div>
             <div className="text-sm text-gray-600 dark:text-gray-400">Packed</div>
           </div>
           
           <div className="bg-white dark:bg-gray-800 border border-gray-200 dark:border-gray-600 rounded-lg p-4 text-center">
             <div className="text-2xl font-bold text-orange-600 dark:text-orange-400">
-              {packing.lists.length > 0 ? Math.round(packing.lists.reduce((total, list) => total + list.completionPercentage, 0) / packing.lists.length) : 0}%
+              {packingStats.averageCompletion}%
             </div>
             <div className="text-sm text-gray-600 dark:text-gray-400">Complete</div>
           </div>
@@ -712,6 +731,16 @@ export const PackingLists = React.forwardRef<HTMLDivElement, PackingListsProps>(
                 <div className="bg-white dark:bg-gray-800 border border-gray-200 dark:border-gray-600 rounded-lg p-6">
                   {(() => {
                     const list = packing.lists.find(l => l.id === selectedList)!;
+                    // Group items by category in a single pass
+                    const itemsByCategory = new Map<string, PackingItem[]>();
+                    list.items.forEach(item => {
+                      const group = itemsByCategory.get(item.category);
+                      if (group) {
+                        group.push(item);
+                      } else {
+                        itemsByCategory.set(item.category, [item]);
+                      }
+                    });
                     return (
                       <div className="space-y-6">
                         <div className="flex items-center justify-between">
@@ -725,7 +754,7 @@ export const PackingLists = React.forwardRef<HTMLDivElement, PackingListsProps>(
                         
                         <div className="space-y-4">
                           {defaultCategories.map((category) => {
-                            const categoryItems = list.items.filter(item => item.category === category.id);
+                            const categoryItems = itemsByCategory.get(category.id) || [];
                             if (categoryItems.length === 0) return null;
                             
                             return (
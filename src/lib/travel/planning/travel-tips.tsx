@@ -10,7 +10,7 @@
 
 'use client';
 
-import React, { useState, useEffect, useCallback, useRef } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { cva, type VariantProps } from 'class-variance-authority';
 import { cn } from '@/lib/utils';
 
@@ -190,6 +190,43 @@ interface TipsSettings {
   autoBookmark: boolean;
 }
 
+// Static lookup tables, built once at module load rather than on every render
+const TABS = [
+  { id: 'all', name: 'All Tips', icon: '💡' },
+  { id: 'personalized', name: 'Personalized', icon: '🎯' },
+  { id: 'local', name: 'Local Insights', icon: '🏘️' },
+  { id: 'favorites', name: 'Favorites', icon: '⭐' },
+  { id: 'categories', name: 'Categories', icon: '📁' }
+];
+
+const TIP_TYPES = [
+  { id: 'general', name: 'General', icon: '🌍', color: 'blue' },
+  { id: 'destination', name: 'Destination', icon: '📍', color: 'green' },
+  { id: 'cultural', name: 'Cultural', icon: '🎭', color: 'purple' },
+  { id: 'practical', name: 'Practical', icon: '🛠️', color: 'orange' },
+  { id: 'safety', name: 'Safety', icon: '🛡️', color: 'red' },
+  { id: 'budget', name: 'Budget', icon: '💰', color: 'yellow' },
+  { id: 'food', name: 'Food', icon: '🍽️', color: 'pink' },
+  { id: 'transportation', name: 'Transportation', icon: '🚗', color: 'indigo' }
+];
+
+const DEFAULT_CATEGORIES = [
+  { id: 'getting-around', name: 'Getting Around', icon: '🚗', color: 'blue', description: 'Transportation tips', subcategories: ['public-transport', 'taxi', 'rental-car', 'walking'], isPopular: true, tipCount: 0 },
+  { id: 'accommodation', name: 'Accommodation', icon: '🏨', color: 'green', description: 'Where to stay', subcategories: ['hotels', 'hostels', 'airbnb', 'booking'], isPopular: true, tipCount: 0 },
+  { id: 'food-drink', name: 'Food & Drink', icon: '🍽️', color: 'orange', description: 'Dining recommendations', subcategories: ['restaurants', 'street-food', 'local-cuisine', 'drinks'], isPopular: true, tipCount: 0 },
+  { id: 'attractions', name: 'Attractions', icon: '🎯', color: 'purple', description: 'Things to see and do', subcategories: ['museums', 'landmarks', 'nature', 'activities'], isPopular: true, tipCount: 0 },
+  { id: 'culture-etiquette', name: 'Culture & Etiquette', icon: '🎭', color: 'pink', description: 'Cultural norms and customs', subcategories: ['dress-code', 'behavior', 'traditions', 'language'], isPopular: false, tipCount: 0 },
+  { id: 'safety-security', name: 'Safety & Security', icon: '🛡️', color: 'red', description: 'Safety tips and precautions', subcategories: ['personal-safety', 'scams', 'emergencies', 'health'], isPopular: true, tipCount: 0 },
+  { id: 'money-budget', name: 'Money & Budget', icon: '💰', color: 'yellow', description: 'Financial tips', subcategories: ['currency', 'tipping', 'bargaining', 'budgeting'], isPopular: false, tipCount: 0 },
+  { id: 'communication', name: 'Communication', icon: '📱', color: 'indigo', description: 'Language and communication', subcategories: ['language', 'wifi', 'sim-cards', 'apps'], isPopular: false, tipCount: 0 }
+];
+
+const DIFFICULTY_LEVELS = [
+  { id: 'beginner', name: 'Beginner', icon: '🟢', color: 'green' },
+  { id: 'intermediate', name: 'Intermediate', icon: '🟡', color: 'yellow' },
+  { id: 'advanced', name: 'Advanced', icon: '🔴', color: 'red' }
+];
+
 // Travel Tips Component
 export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
   ({ 
@@ -238,42 +275,6 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
     const [searchQuery, setSearchQuery] = useState('');
     const [selectedTip, setSelectedTip] = useState<TravelTip | null>(null);
 
-    const tabs = [
-      { id: 'all', name: 'All Tips', icon: '💡' },
-      { id: 'personalized', name: 'Personalized', icon: '🎯' },
-      { id: 'local', name: 'Local Insights', icon: '🏘️' },
-      { id: 'favorites', name: 'Favorites', icon: '⭐' },
-      { id: 'categories', name: 'Categories', icon: '📁' }
-    ];
-
-    const tipTypes = [
-      { id: 'general', name: 'General', icon: '🌍', color: 'blue' },
-      { id: 'destination', name: 'Destination', icon: '📍', color: 'green' },
-      { id: 'cultural', name: 'Cultural', icon: '🎭', color: 'purple' },
-      { id: 'practical', name: 'Practical', icon: '🛠️', color: 'orange' },
-      { id: 'safety', name: 'Safety', icon: '🛡️', color: 'red' },
-      { id: 'budget', name: 'Budget', icon: '💰', color: 'yellow' },
-      { id: 'food', name: 'Food', icon: '🍽️', color: 'pink' },
-      { id: 'transportation', name: 'Transportation', icon: '🚗', color: 'indigo' }
-    ];
-
-    const defaultCategories = [
-      { id: 'getting-around', name: 'Getting Around', icon: '🚗', color: 'blue', description: 'Transportation tips', subcategories: ['public-transport', 'taxi', 'rental-car', 'walking'], isPopular: true, tipCount: 0 },
-      { id: 'accommodation', name: 'Accommodation', icon: '🏨', color: 'green', description: 'Where to stay', subcategories: ['hotels', 'hostels', 'airbnb', 'booking'], isPopular: true, tipCount: 0 },
-      { id: 'food-drink', name: 'Food & Drink', icon: '🍽️', color: 'orange', description: 'Dining recommendations', subcategories: ['restaurants', 'street-food', 'local-cuisine', 'drinks'], isPopular: true, tipCount: 0 },
-      { id: 'attractions', name: 'Attractions', icon: '🎯', color: 'purple', description: 'Things to see and do', subcategories: ['museums', 'landmarks', 'nature', 'activities'], isPopular: true, tipCount: 0 },
-      { id: 'culture-etiquette', name: 'Culture & Etiquette', icon: '🎭', color: 'pink', description: 'Cultural norms and customs', subcategories: ['dress-code', 'behavior', 'traditions', 'language'], isPopular: false, tipCount: 0 },
-      { id: 'safety-security', name: 'Safety & Security', icon: '🛡️', color: 'red', description: 'Safety tips and precautions', subcategories: ['personal-safety', 'scams', 'emergencies', 'health'], isPopular: true, tipCount: 0 },
-      { id: 'money-budget', name: 'Money & Budget', icon: '💰', color: 'yellow', description: 'Financial tips', subcategories: ['currency', 'tipping', 'bargaining', 'budgeting'], isPopular: false, tipCount: 0 },
-      { id: 'communication', name: 'Communication', icon: '📱', color: 'indigo', description: 'Language and communication', subcategories: ['language', 'wifi', 'sim-cards', 'apps'], isPopular: false, tipCount: 0 }
-    ];
-
-    const difficultyLevels = [
-      { id: 'beginner', name: 'Beginner', icon: '🟢', color: 'green' },
-      { id: 'intermediate', name: 'Intermediate', icon: '🟡', color: 'yellow' },
-      { id: 'advanced', name: 'Advanced', icon: '🔴', color: 'red' }
-    ];
-
     const updateTips = useCallback((path: string, value: any) => {
       setTips(prev => {
         const newTips = { ...prev };
@@ -358,7 +359,8 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
 
     const initializeCategories = useCallback(() => {
       if (tips.categories.length === 0) {
-        updateTips('categories', defaultCategories);
+        // Copy the defaults so edits to the plan's categories can't mutate the shared constant
+        updateTips('categories', structuredClone(DEFAULT_CATEGORIES));
       }
     }, [tips.categories.length, updateTips]);
 
@@ -371,17 +373,17 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
     };
 
     const getTipTypeIcon = (type: TravelTip['type']) => {
-      const tipType = tipTypes.find(t => t.id === type);
+      const tipType = TIP_TYPES.find(t => t.id === type);
       return tipType?.icon || '💡';
     };
 
     const getTipTypeName = (type: TravelTip['type']) => {
-      const tipType = tipTypes.find(t => t.id === type);
+      const tipType = TIP_TYPES.find(t => t.id === type);
       return tipType?.name || type;
     };
 
     const getTipTypeColor = (type: TravelTip['type']) => {
-      const tipType = tipTypes.find(t => t.id === type);
+      const tipType = TIP_TYPES.find(t => t.id === type);
       return tipType?.color || 'gray';
     };
 
@@ -395,17 +397,17 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
     };
 
     const getDifficultyColor = (difficulty: TravelTip['difficulty']) => {
-      const difficultyLevel = difficultyLevels.find(d => d.id === difficulty);
+      const difficultyLevel = DIFFICULTY_LEVELS.find(d => d.id === difficulty);
       return difficultyLevel?.color || 'gray';
     };
 
     const getCategoryIcon = (categoryId: string) => {
-      const category = defaultCategories.find(c => c.id === categoryId);
+      const category = DEFAULT_CATEGORIES.find(c => c.id === categoryId);
       return category?.icon || '📁';
     };
 
     const getCategoryName = (categoryId: string) => {
-      const category = defaultCategories.find(c => c.id === categoryId);
+      const category = DEFAULT_CATEGORIES.find(c => c.id === categoryId);
       return category?.name || categoryId;
     };
 
@@ -432,10 +434,11 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
 
       // Filter by search query
       if (searchQuery) {
+        const normalizedQuery = searchQuery.toLowerCase();
         filteredTips = filteredTips.filter(tip => 
-          tip.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          tip.description.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          tip.tags.some(tag => tag.toLowerCase().includes(searchQuery.toLowerCase()))
+          tip.title.toLowerCase().includes(normalizedQuery) ||
+          tip.description.toLowerCase().includes(normalizedQuery) ||
+          tip.tags.some(tag => tag.toLowerCase().includes(normalizedQuery))
         );
       }
 
@@ -453,6 +456,14 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
       return filteredTips;
     }, [tips.tips, activeTab, selectedCategory, searchQuery, tips.settings]);
 
+    const tipCountsByCategory = useMemo(() => {
+      const counts = new Map<string, number>();
+      tips.tips.forEach(tip => {
+        counts.set(tip.category, (counts.get(tip.category) || 0) + 1);
+      });
+      return counts;
+    }, [tips.tips]);
+
     useEffect(() => {
       initializeCategories();
     }, [initializeCategories]);
@@ -509,7 +520,7 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
                 className="p-2 border border-gray-300 dark:border-gray-600 rounded-md dark:bg-gray-700 dark:text-gray-300"
               >
                 <option value="">All Categories</option>
-                {defaultCategories.map((category) => (
+                {DEFAULT_CATEGORIES.map((category) => (
                   <option key={category.id} value={category.id}>
                     {category.icon} {category.name}
                   </option>
@@ -552,7 +563,7 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
 
         {/* Tabs */}
         <div className="flex gap-1 border-b border-gray-200 dark:border-gray-600">
-          {tabs.map((tab) => (
+          {TABS.map((tab) => (
             <button
               key={tab.id}
               onClick={() => setActiveTab(tab.id)}
@@ -717,7 +728,7 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
               </h3>
               
               <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-                {defaultCategories.map((category) => (
+                {DEFAULT_CATEGORIES.map((category) => (
                   <div key={category.id} className="bg-white dark:bg-gray-800 border border-gray-200 dark:border-gray-600 rounded-lg p-4">
                     <div className="flex items-center gap-3 mb-3">
                       <span className="text-2xl">{category.icon}</span>
@@ -735,7 +746,7 @@ export const TravelTips = React.forwardRef<HTMLDivElement, TravelTipsProps>(
                       <div className="flex justify-between">
                         <span>Tips:</span>
                         <span className="font-medium text-gray-900 dark:text-gray-100">
-                          {tips.tips.filter(tip => tip.category === category.id).length}
+                          {tipCountsByCategory.get(category.id) || 0}
                         </span>
                       </div>
                       <div className="flex justify-between">
@@ -166,9 +166,10 @@ export const Search = React.forwardRef<HTMLDivElement, SearchProps>(
       debounceRef.current = setTimeout(() => {
         if (value.trim()) {
           // Filter suggestions based on query
+          const normalizedQuery = value.toLowerCase();
           const filteredSuggestions = mockSuggestions
             .filter(suggestion => 
-              suggestion.toLowerCase().includes(value.toLowerCase())
+              suggestion.toLowerCase().includes(normalizedQuery)
             )
             .slice(0, maxSuggestions);
           setSuggestions(filteredSuggestions);
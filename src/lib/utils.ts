@@ -5,9 +5,33 @@ export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
 
+// Intl formatters are expensive to construct, so reuse them per locale/options
+const dateFormatters = new Map<string, Intl.DateTimeFormat>();
+const numberFormatters = new Map<string, Intl.NumberFormat>();
+
+function getDateFormatter(locale: string, options: Intl.DateTimeFormatOptions): Intl.DateTimeFormat {
+  const key = `${locale}:${JSON.stringify(options)}`;
+  let formatter = dateFormatters.get(key);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat(locale, options);
+    dateFormatters.set(key, formatter);
+  }
+  return formatter;
+}
+
+function getNumberFormatter(locale: string, options: Intl.NumberFormatOptions): Intl.NumberFormat {
+  const key = `${locale}:${JSON.stringify(options)}`;
+  let formatter = numberFormatters.get(key);
+  if (!formatter) {
+    formatter = new Intl.NumberFormat(locale, options);
+    numberFormatters.set(key, formatter);
+  }
+  return formatter;
+}
+
 export function formatDate(date: Date | string, locale = 'en-US'): string {
   const dateObj = typeof date === 'string' ? new Date(date) : date;
-  return new Intl.DateTimeFormat(locale, {
+  return getDateFormatter(locale, {
     year: 'numeric',
     month: 'long',
     day: 'numeric',
@@ -15,14 +39,14 @@ export function formatDate(date: Date | string, locale = 'en-US'): string {
 }
 
 export function formatCurrency(amount: number, currency = 'USD', locale = 'en-US'): string {
-  return new Intl.NumberFormat(locale, {
+  return getNumberFormatter(locale, {
     style: 'currency',
     currency,
   }).format(amount);
 }
 
 export function formatDistance(distance: number, locale = 'en-US'): string {
-  return new Intl.NumberFormat(locale, {
+  return getNumberFormatter(locale, {
     style: 'unit',
     unit: 'kilometer',
     unitDisplay: 'short',
@@ -1,10 +1,20 @@
 import { z } from 'zod';
 import DOMPurify from 'isomorphic-dompurify';
 
+// Characters that make DOMPurify's output differ from its input
+const HTML_SENSITIVE_CHARS = /[<>&\r\u00a0\0]/;
+
 // Security validation schemas
 export const sanitizeInput = (input: string): string => {
+  const trimmed = input.trim();
+
+  // Plain text passes through DOMPurify unchanged, so skip the HTML parse
+  if (!HTML_SENSITIVE_CHARS.test(trimmed)) {
+    return trimmed;
+  }
+
   // Remove potentially dangerous characters and normalize
-  return DOMPurify.sanitize(input.trim(), {
+  return DOMPurify.sanitize(trimmed, {
     ALLOWED_TAGS: [],
     ALLOWED_ATTR: [],
     KEEP_CONTENT: true,
@@ -125,17 +135,17 @@ export const sanitizeForDatabase = (input: string): string => {
 };
 
 // XSS prevention
+const HTML_ESCAPE_MAP: Record<string, string> = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#39;',
+  '/': '&#x2F;',
+};
+
 export const escapeHtml = (input: string): string => {
-  const map: Record<string, string> = {
-    '&': '&amp;',
-    '<': '&lt;',
-    '>': '&gt;',
-    '"': '&quot;',
-    "'": '&#39;',
-    '/': '&#x2F;',
-  };
-  
-  return input.replace(/[&<>"'/]/g, (s) => map[s] || s);
+  return input.replace(/[&<>"'/]/g, (s) => HTML_ESCAPE_MAP[s] || s);
 };
 
 // Rate limiting validation
@@ -150,15 +160,15 @@ export const rateLimitSchema = z.object({
 // Validation helper functions
 export const validateAndSanitize = <T>(schema: z.ZodSchema<T>, data: unknown): { success: true; data: T } | { success: false; errors: string[] } => {
   try {
-    const result = schema.parse(data);
-    return { success: true, data: result };
-  } catch (error) {
-    if (error instanceof z.ZodError) {
-      return {
-        success: false,
-        errors: error.errors.map(err => `${err.path.join('.')}: ${err.message}`)
-      };
+    const result = schema.safeParse(data);
+    if (result.success) {
+      return { success: true, data: result.data };
     }
+    return {
+      success: false,
+      errors: result.error.errors.map(err => `${err.path.join('.')}: ${err.message}`)
+    };
+  } catch (error) {
     return {
       success: false,
       errors: ['Validation failed']
@@ -94,8 +94,8 @@ export const locationSchema = z.object({
 
 // Enhanced time slot schema with time validation
 export const timeSlotSchema = z.object({
-  start: z.string().regex(/^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$/, 'Start time must be in HH:MM format'),
-  end: z.string().regex(/^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$/, 'End time must be in HH:MM format'),
+  start: z.string().regex(/^(?:[0-1]?[0-9]|2[0-3]):[0-5][0-9]$/, 'Start time must be in HH:MM format'),
+  end: z.string().regex(/^(?:[0-1]?[0-9]|2[0-3]):[0-5][0-9]$/, 'End time must be in HH:MM format'),
   flexible: z.boolean().default(false),
 }).refine(
   (data) => {
@@ -307,15 +307,11 @@ export class ValidationService {
     data?: T;
     errors?: z.ZodError;
   } {
-    try {
-      const result = schema.parse(data);
-      return { success: true, data: result };
-    } catch (error) {
-      if (error instanceof z.ZodError) {
-        return { success: false, errors: error };
-      }
-      throw error;
+    const result = schema.safeParse(data);
+    if (result.success) {
+      return { success: true, data: result.data };
     }
+    return { success: false, errors: result.error };
   }
 
   /**
@@ -330,7 +326,8 @@ export class ValidationService {
    */
   static safeValidate<T>(schema: z.ZodSchema<T>, data: unknown): T | null {
     try {
-      return schema.parse(data);
+      const result = schema.safeParse(data);
+      return result.success ? result.data : null;
     } catch {
       return null;
     }
@@ -52,8 +52,8 @@ export const locationSchema = z.object({
 });
 
 export const timeSlotSchema = z.object({
-  start: z.string().regex(/^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$/),
-  end: z.string().regex(/^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$/),
+  start: z.string().regex(/^(?:[0-1]?[0-9]|2[0-3]):[0-5][0-9]$/),
+  end: z.string().regex(/^(?:[0-1]?[0-9]|2[0-3]):[0-5][0-9]$/),
   flexible: z.boolean().default(false),
 });
 